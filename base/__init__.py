@@ -4,3 +4,4 @@ from base.display import Display
 from base.enums import *
 from base.client import GameClient
 from base.images import display_image
+from base.async_client import AsyncBaseClient, AsyncCharacter, AsyncGameClient
@@ -0,0 +1,188 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from base import deadline
+from base.client import GameClient
+
+
+def _awaitable(name):
+    """Build a coroutine method that runs ``self.client.<name>`` on the executor."""
+
+    async def method(self, *args, **kwargs):
+        return await self._run(getattr(self.client, name), *args, **kwargs)
+
+    method.__name__ = name
+    method.__qualname__ = name
+    method.__doc__ = f'Awaitable version of ``{name}``.'
+
+    return method
+
+
+def _awaitable_action(name):
+    """Like _awaitable, but awaits the character's cooldown before taking an executor thread."""
+
+    async def method(self, *args, **kwargs):
+        await self.wait_for_cooldown()
+        return await self._run(getattr(self.client, name), *args, **kwargs)
+
+    method.__name__ = name
+    method.__qualname__ = name
+    method.__doc__ = f'Awaitable version of ``{name}``.'
+
+    return method
+
+
+class AsyncBaseClient:
+    """Asyncio front for a blocking BaseClient.
+
+    Calls are dispatched to a bounded executor sized to the client's
+    connection pool, so one event loop can keep ``pool_size`` requests in
+    flight at once without starting a thread per call. The wrapped client
+    keeps its pooled session, so keep-alive connections are reused. The
+    calling task's context, and with it any ``deadline()``, is carried over
+    to the worker thread.
+    """
+
+    def __init__(self, client, executor=None):
+        self.client = client
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=client.pool_size,
+            thread_name_prefix='artifacts-io',
+        )
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self._executor, deadline.bind(functools.partial(func, *args, **kwargs)))
+
+    async def _post(self, url='', data=None):
+        """Send POST request."""
+
+        return await self._run(self.client._post, url=url, data=data)
+
+    async def _get(self, url='', data=None):
+        """Send GET request."""
+
+        return await self._run(self.client._get, url=url, data=data)
+
+    async def _delete(self, url='', data=None):
+        """Send DELETE request."""
+
+        return await self._run(self.client._delete, url=url, data=data)
+
+    async def _put(self, url='', data=None):
+        """Send PUT request."""
+
+        return await self._run(self.client._put, url=url, data=data)
+
+    def close(self):
+        """Stop the executor (if owned) and close the wrapped client."""
+
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+        self.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class AsyncGameClient(AsyncBaseClient):
+    """Awaitable account-level API: every ``get_*`` fetcher of GameClient."""
+
+    FETCHERS = (
+        'get_my_characters', 'get_account_details', 'get_location_data',
+        'get_maps_data', 'get_items', 'get_item', 'get_items_by_codes',
+        'get_monsters', 'get_monster', 'get_resources', 'get_resource',
+        'get_maps', 'get_map_by_id', 'get_layer_maps', 'get_map_by_position',
+        'get_npcs', 'get_npc', 'get_npc_items', 'get_all_npc_items',
+        'get_tasks', 'get_task', 'get_task_rewards', 'get_task_reward',
+        'get_achievements', 'get_achievement', 'get_account_achievements',
+        'get_badges', 'get_badge', 'get_effects', 'get_effect', 'get_events',
+        'get_active_events', 'get_ge_history_by_code', 'get_ge_orders',
+        'get_ge_order', 'get_my_ge_orders', 'get_my_ge_history',
+        'get_my_pending_items', 'get_my_logs', 'get_character_logs',
+        'get_my_bank', 'get_my_bank_items', 'get_leaderboard_accounts',
+        'get_leaderboard_characters', 'get_active_characters',
+        'get_account_characters', 'get_account_info',
+    )
+
+    def __init__(self, client=None, display=None, executor=None):
+        super().__init__(client or GameClient(display=display), executor=executor)
+
+    async def character(self, name):
+        """Load a character and return its awaitable wrapper.
+
+        The character shares this client's session and executor.
+        """
+
+        character = await self._run(self.client._build_character, name)
+
+        return AsyncCharacter(character, executor=self._executor)
+
+
+class AsyncCharacter(AsyncBaseClient):
+    """Awaitable character actions.
+
+    Plain attributes (``hp``, ``x``, ``inventory``, ...) are read straight
+    from the wrapped Character. An action first sleeps out the previous
+    action's cooldown on the event loop, so waiting characters hold no
+    worker thread.
+    """
+
+    ACTIONS = (
+        'refresh', 'move', 'transition', 'fight', 'gathering', 'crafting',
+        'recycling', 'equip', 'unequip', 'use_item', 'delete_item', 'rest',
+        'change_skin', 'get_task', 'complete_task', 'cancel_task',
+        'exchange_task_coins', 'trade_task', 'deposit_item', 'deposit_items',
+        'deposit_gold', 'withdraw_item', 'withdraw_items', 'withdraw_gold',
+        'buy_bank_expansion', 'give_gold', 'give_item', 'claim_pending_item',
+        'ge_buy', 'ge_sell', 'ge_create_buy_order', 'ge_create_sell_order',
+        'ge_fill', 'ge_cancel', 'npc_buy', 'npc_sell',
+    )
+
+    async def wait_for_cooldown(self):
+        remaining = self.client.cooldown_remaining()
+        if remaining <= 0:
+            return
+
+        budget = deadline.remaining()
+        if budget is not None and budget < remaining:
+            raise deadline.DeadlineExceeded('cooldown outlasts the deadline')
+
+        await asyncio.sleep(remaining)
+
+    async def run_queue(self, stop_on_failure=True):
+        """Awaitable version of ``run_queue``; cooldowns are slept out on the event loop."""
+
+        queue = self.client._take_queue()
+        results = []
+        while queue:
+            action, args, kwargs = queue.popleft()
+            if action in self.ACTIONS:
+                result = await getattr(self, action)(*args, **kwargs)
+            else:
+                result = await self._run(getattr(self.client, action), *args, **kwargs)
+            if result:
+                results.append(result)
+            elif stop_on_failure:
+                break
+
+        return results
+
+    def __getattr__(self, name):
+        if name == 'client':
+            raise AttributeError(name)
+
+        return getattr(self.client, name)
+
+
+for _name in AsyncGameClient.FETCHERS:
+    setattr(AsyncGameClient, _name, _awaitable(_name))
+
+for _name in AsyncCharacter.ACTIONS:
+    setattr(AsyncCharacter, _name, _awaitable(_name) if _name == 'refresh' else _awaitable_action(_name))
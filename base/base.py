@@ -1,8 +1,16 @@
 import configparser
 import json
-from time import sleep
+from time import monotonic, sleep
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from base import codec, deadline
+from base.cache import ResponseCache
+from base.metrics import Metrics
+from base.ratelimit import RateLimiter
+from base.response import ApiResponse
+from base.singleflight import SingleFlight
 
 
 class _EnumMeta(type):
@@ -22,9 +30,21 @@ class BaseEnumerate(metaclass=_EnumMeta):
 
 
 class BaseClient:
-    """Basic client for sending requests."""
+    """Basic client for sending requests.
+
+    All requests go through a pooled keep-alive ``requests.Session``. A client
+    created with a ``parent`` reuses the parent's session, rate limiter,
+    response cache, in-flight GET table and metrics instead of creating its
+    own, so a GameClient and all of its characters share one pool and one
+    cache, are paced against the account's rate limits together and report
+    into one set of transport metrics.
+    """
+
+    DEFAULT_POOL_SIZE = 10
+    DEFAULT_CONNECT_TIMEOUT = 5
+    DEFAULT_READ_TIMEOUT = 30
 
-    def __init__(self):
+    def __init__(self, parent=None, pool_size=None, timeout=None):
         self.base_url = "https://api.artifactsmmo.com"
 
         self.base_headers = {
@@ -32,6 +52,49 @@ class BaseClient:
             "Accept": "application/json",
         }
 
+        if parent is not None:
+            self.base_url = parent.base_url
+            self.pool_size = parent.pool_size
+            self.timeout = parent.timeout
+            self.session = parent.session
+            self.rate_limiter = parent.rate_limiter
+            self.cache = parent.cache
+            self.inflight = parent.inflight
+            self.metrics = parent.metrics
+            self._owns_session = False
+        else:
+            self.pool_size = pool_size or self.DEFAULT_POOL_SIZE
+            self.timeout = timeout or (self.DEFAULT_CONNECT_TIMEOUT, self.DEFAULT_READ_TIMEOUT)
+            self.session = self._build_session(self.pool_size)
+            self.rate_limiter = RateLimiter()
+            self.cache = ResponseCache()
+            self.inflight = SingleFlight()
+            self.metrics = Metrics()
+            self._owns_session = True
+
+    @staticmethod
+    def _build_session(pool_size):
+        """Create a session whose adapter keeps up to pool_size connections alive."""
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        return session
+
+    def close(self):
+        """Close pooled connections. Clients sharing a parent's session leave it open."""
+
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _post(self, url='', data=None):
         """Send POST request."""
 
@@ -53,7 +116,11 @@ class BaseClient:
         return self._do_request(method='put', url=url, data=data)
 
     def _do_request(self, method='get', url='', data=None, extra_headers=None):
-        """Send request to game with simple reconnect on transient failures."""
+        """Send request to game. Returns an already decoded ApiResponse.
+
+        Concurrent identical GETs share one network request and one parsed
+        response through the single-flight table.
+        """
 
         headers = dict(self.base_headers)
         if extra_headers:
@@ -65,35 +132,120 @@ class BaseClient:
             'headers': headers,
         }
 
-        if method == 'get':
-            if data:
-                params['params'] = data
-        else:
+        if method != 'get':
             if data:
-                params['json'] = data
+                params['data'] = codec.dumps(data)
+            return self._send(method, url, params)
+
+        if data:
+            params['params'] = data
+
+        flight_key = (ResponseCache.key(url, data), headers.get('Authorization'))
+        return self.inflight.do(flight_key, lambda: self._get_cached(url, data, params))
+
+    def _get_cached(self, url, data, params):
+        """Run a GET, answering static-data URLs from the cache.
+
+        Fresh cache entries are returned without a request; stale ones are
+        revalidated with If-None-Match / If-Modified-Since.
+        """
+
+        ttl = self.cache.ttl_for(url)
+        if ttl is None:
+            return self._send('get', url, params)
+
+        key = self.cache.key(url, data)
+        entry = self.cache.lookup(key)
+        if entry is not None:
+            if entry.is_fresh():
+                return entry.response
+            params['headers'].update(entry.validators())
+
+        response = self._send('get', url, params)
 
+        if response.status_code == ResponseCache.NOT_MODIFIED and entry is not None:
+            return self.cache.revalidate(key, entry, ttl)
+
+        if response.status_code == 200:
+            self.cache.store(key, response, ttl)
+
+        return response
+
+    def _attempt_timeout(self):
+        """(connect, read) timeout for the next attempt, cut to the remaining deadline."""
+
+        deadline.check()
+        left = deadline.remaining()
+        if left is None:
+            return self.timeout
+
+        return tuple(min(value, left) for value in self.timeout)
+
+    def _send(self, method, url, params):
+        """Run one request with simple reconnect on transient failures.
+
+        Every attempt first takes a token from the rate limiter bucket of the
+        request's category; 429 responses are retried once the bucket's
+        Retry-After block has passed. Attempts use the client's connect/read
+        timeouts, shortened to what is left of the current ``deadline()``;
+        once it has passed, or when the rate limiter would make the next
+        attempt wait past it, DeadlineExceeded is raised instead of retrying.
+        The finished call, retries included, is recorded in ``self.metrics``.
+        """
+
+        category = self.rate_limiter.category_for(method, url)
         attempts = 0
         max_attempts = 5
+        throttled = 0.0
+        started = monotonic()
         while True:
             try:
-                request = requests.request(**params)
-                if request.status_code != 204:
-                    request.json()
+                waiting = monotonic()
+                self.rate_limiter.acquire(category)
+                throttled += monotonic() - waiting
+                request = self.session.request(**params, timeout=self._attempt_timeout())
+                self.rate_limiter.observe(category, request)
+                if request.status_code == RateLimiter.TOO_MANY_REQUESTS and attempts + 1 < max_attempts:
+                    attempts += 1
+                    continue
+                response = ApiResponse(request)
                 break
-            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            except deadline.DeadlineExceeded as error:
+                self._record_failure(method, url, started, attempts, throttled, error)
+                raise
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as error:
                 attempts += 1
                 if attempts >= max_attempts:
+                    self._record_failure(method, url, started, attempts - 1, throttled, error)
                     raise
-                sleep(1)
+                self._retry_pause()
                 continue
-            except json.JSONDecodeError:
+            except json.JSONDecodeError as error:
                 attempts += 1
                 if attempts >= max_attempts:
+                    self._record_failure(method, url, started, attempts - 1, throttled, error)
                     raise
-                sleep(1)
+                self._retry_pause()
                 continue
 
-        return request
+        self.metrics.record(
+            method, url, monotonic() - started, response.status_code,
+            size=len(response.content), retries=attempts, throttled=throttled,
+            error=not response.ok,
+        )
+
+        return response
+
+    @staticmethod
+    def _retry_pause():
+        left = deadline.remaining()
+        sleep(1 if left is None else max(0, min(1, left)))
+
+    def _record_failure(self, method, url, started, retries, throttled, error):
+        self.metrics.record(
+            method, url, monotonic() - started, type(error).__name__,
+            retries=retries, throttled=throttled, error=True,
+        )
 
 
 class BaseGameClient(BaseClient):
@@ -102,13 +254,35 @@ class BaseGameClient(BaseClient):
     CONFIG_PATH = 'config.ini'
     CONFIG_SECTION = 'General'
     CONFIG_TOKEN_KEY = 'TOKEN'
+    CONFIG_POOL_SIZE_KEY = 'POOL_SIZE'
+    CONFIG_METRICS_FILE_KEY = 'METRICS_FILE'
+    CONFIG_CONNECT_TIMEOUT_KEY = 'CONNECT_TIMEOUT'
+    CONFIG_READ_TIMEOUT_KEY = 'READ_TIMEOUT'
 
-    def __init__(self):
-        super().__init__()
-
+    def __init__(self, parent=None):
         self.config = self._get_config()
+        pool_size = self.config.getint(
+            self.CONFIG_SECTION, self.CONFIG_POOL_SIZE_KEY, fallback=self.DEFAULT_POOL_SIZE,
+        )
+        timeout = (
+            self.config.getfloat(
+                self.CONFIG_SECTION, self.CONFIG_CONNECT_TIMEOUT_KEY, fallback=self.DEFAULT_CONNECT_TIMEOUT,
+            ),
+            self.config.getfloat(
+                self.CONFIG_SECTION, self.CONFIG_READ_TIMEOUT_KEY, fallback=self.DEFAULT_READ_TIMEOUT,
+            ),
+        )
+        super().__init__(parent=parent, pool_size=pool_size, timeout=timeout)
+
         self._apply_token(self.config.get(self.CONFIG_SECTION, self.CONFIG_TOKEN_KEY, fallback=''))
 
+    def dump_metrics(self):
+        """Write the transport metrics to METRICS_FILE, if one is configured."""
+
+        path = self.config.get(self.CONFIG_SECTION, self.CONFIG_METRICS_FILE_KEY, fallback='')
+        if path:
+            self.metrics.dump_json(path)
+
     def _get_config(self):
         """Open config file."""
 
@@ -142,10 +316,7 @@ class BaseGameClient(BaseClient):
         if response.status_code in (401, 403, 452):
             return True
 
-        try:
-            error_block = response.json().get('error', {}) or {}
-        except ValueError:
-            error_block = {}
+        error_block = response.error or {}
 
         message = (error_block.get('message') or '').lower()
         keywords = (
@@ -214,7 +385,7 @@ class BaseGameClient(BaseClient):
         )
 
         if response.status_code == 200:
-            token = response.json().get('token')
+            token = response.payload.get('token')
             if not token:
                 print('Server returned an empty token.')
                 return False, False
@@ -255,11 +426,8 @@ class BaseGameClient(BaseClient):
 
     @staticmethod
     def _extract_error(response):
-        try:
-            err = response.json().get('error', {}) or {}
-            return err.get('message', f'HTTP {response.status_code}'), err.get('code', '?')
-        except ValueError:
-            return f'HTTP {response.status_code}', '?'
+        err = response.error or {}
+        return err.get('message', f'HTTP {response.status_code}'), err.get('code', '?')
 
     def ensure_valid_token(self, probe_response=None):
         """If the most recent auth call failed because of an invalid token,
@@ -281,12 +449,7 @@ class BaseGameClient(BaseClient):
     def _get_data(response):
         """Return data block from a JSON response or an empty container."""
 
-        try:
-            payload = response.json()
-        except ValueError:
-            return {}
-
-        if response.status_code >= 400:
+        if not response.ok:
             return {}
 
-        return payload.get('data', {})
+        return response.data or {}
@@ -0,0 +1,132 @@
+import threading
+from collections import OrderedDict
+from time import monotonic
+
+
+class CacheEntry:
+    """A cached response together with its expiry and revalidation headers."""
+
+    __slots__ = ('response', 'expires_at', 'etag', 'last_modified')
+
+    def __init__(self, response, ttl):
+        self.response = response
+        self.expires_at = monotonic() + ttl
+        self.etag = response.headers.get('ETag')
+        self.last_modified = response.headers.get('Last-Modified')
+
+    def is_fresh(self):
+        return monotonic() < self.expires_at
+
+    def validators(self):
+        """Conditional request headers for revalidating this entry."""
+
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+
+        return headers
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of GET responses for static game data.
+
+    Only URLs under one of the ``ttls`` prefixes are cached, each for its
+    own TTL. Expired entries are kept until evicted so they can be
+    revalidated with ETag / Last-Modified; a 304 answer extends them without
+    downloading the body again.
+    """
+
+    DEFAULT_TTLS = (
+        ('/items', 3600),
+        ('/monsters', 3600),
+        ('/resources', 3600),
+        ('/npcs/details', 3600),
+        ('/effects', 3600),
+        ('/badges', 3600),
+        ('/achievements', 3600),
+        ('/tasks/list', 3600),
+    )
+    DEFAULT_MAX_ENTRIES = 2048
+
+    NOT_MODIFIED = 304
+
+    def __init__(self, ttls=None, max_entries=None):
+        self.ttls = tuple(ttls if ttls is not None else self.DEFAULT_TTLS)
+        self.max_entries = max_entries or self.DEFAULT_MAX_ENTRIES
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.evictions = 0
+
+    def ttl_for(self, url):
+        """TTL in seconds for a cacheable URL, or None if it must not be cached."""
+
+        for prefix, ttl in self.ttls:
+            if url == prefix or url.startswith(prefix + '/'):
+                return ttl
+
+        return None
+
+    @staticmethod
+    def key(url, params=None):
+        return url, tuple(sorted((params or {}).items()))
+
+    def lookup(self, key):
+        """Return the entry for key (fresh or stale) and count a hit or miss."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+            if entry is not None and entry.is_fresh():
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        return entry
+
+    def store(self, key, response, ttl):
+        with self._lock:
+            self._put(key, CacheEntry(response, ttl))
+
+    def revalidate(self, key, entry, ttl):
+        """Extend an entry the server confirmed as unchanged; return its response.
+
+        ``entry`` is the one returned by ``lookup``. It is stored again, as
+        it may have been evicted while the conditional request was out.
+        """
+
+        with self._lock:
+            entry.expires_at = monotonic() + ttl
+            self._put(key, entry)
+            self.revalidated += 1
+
+        return entry.response
+
+    def _put(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'revalidated': self.revalidated,
+                'evictions': self.evictions,
+            }
@@ -0,0 +1,260 @@
+import threading
+
+from base.records import RECORD_TYPES
+
+
+def map_content(cell):
+    """The content block of a map cell ({} when empty), for old and new map schemas."""
+
+    return (cell.get('interactions') or {}).get('content') or cell.get('content') or {}
+
+
+def filter_maps(cells, content_type='', content_code='', layer=''):
+    """The cells matching the /maps filters."""
+
+    result = []
+    for cell in cells:
+        content = map_content(cell)
+        if content_type and content.get('type') != content_type:
+            continue
+        if content_code and content.get('code') != content_code:
+            continue
+        if layer and cell.get('layer') != layer:
+            continue
+        result.append(cell)
+
+    return result
+
+
+def nearest_cell(cells, x=0, y=0, layer=None):
+    """The cell closest to (x, y), preferring layer, or None for no cells."""
+
+    if not cells:
+        return None
+
+    return min(
+        cells,
+        key=lambda cell: (
+            layer is not None and cell.get('layer') != layer,
+            abs(cell.get('x', 0) - x) + abs(cell.get('y', 0) - y),
+        ),
+    )
+
+
+class ReverseIndexes:
+    """Lookups the API only answers with a query per question, built once from a catalog.
+
+    ``drop_sources`` maps an item code to the resources and monsters that
+    drop it and ``consumers`` maps an item code to the recipes that use it.
+    Map cells are looked up through ``MapCache`` instead, which follows the
+    event changes.
+    """
+
+    COLLECTIONS = ('items', 'resources', 'monsters')
+
+    def __init__(self, catalog):
+        self.drop_sources = {}
+        self.consumers = {}
+
+        for kind in ('resources', 'monsters'):
+            for source in catalog.records(kind) or []:
+                for drop in source.get('drops') or []:
+                    self.drop_sources.setdefault(drop.get('code'), []).append({
+                        'kind': kind,
+                        'code': source['code'],
+                        'level': source.get('level', 0),
+                        'rate': drop.get('rate'),
+                        'min_quantity': drop.get('min_quantity'),
+                        'max_quantity': drop.get('max_quantity'),
+                    })
+
+        for item in catalog.records('items') or []:
+            for material in (item.get('craft') or {}).get('items') or []:
+                self.consumers.setdefault(material.get('code'), []).append({
+                    'code': item['code'],
+                    'quantity': material.get('quantity', 1),
+                })
+
+    def sources_of(self, item_code):
+        """Resources first (gathering needs no fight), then by level."""
+
+        return sorted(
+            self.drop_sources.get(item_code, []),
+            key=lambda source: (source['kind'] != 'resources', source['level']),
+        )
+
+    def consumer_codes(self, item_code):
+        """Codes of the items whose recipe uses item_code, in catalog order."""
+
+        return list(dict.fromkeys(consumer['code'] for consumer in self.consumers.get(item_code, [])))
+
+
+class Catalog:
+    """Local copy of static game data, keyed by code.
+
+    Filled from any API payload that carries full records, so data fetched
+    once for one purpose can answer later lookups without a request. A
+    collection loaded in full (from a snapshot or a refresh) is marked
+    complete, and only then may list queries be answered from it.
+
+    Items, monsters, resources and map cells are stored as compact slotted
+    records (see ``base.records``); they read like the API dicts.
+
+    ``revision`` goes up with every change, so indexes built from the
+    catalog elsewhere can tell when they are out of date.
+    """
+
+    # Collection name -> list endpoint.
+    COLLECTIONS = {
+        'items': '/items',
+        'monsters': '/monsters',
+        'resources': '/resources',
+        'maps': '/maps',
+        'npcs': '/npcs/details',
+        'npc_items': '/npcs/items',
+        'tasks': '/tasks/list',
+        'effects': '/effects',
+    }
+
+    def __init__(self):
+        self.version = None
+        self.revision = 0
+        self.complete = set()
+        self._collections = {name: {} for name in self.COLLECTIONS}
+        self._indexes = None
+        self._positions = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name, record):
+        if name == 'maps':
+            return record.get('map_id')
+        if name == 'npc_items':
+            return record.get('npc'), record.get('code')
+        return record.get('code')
+
+    @staticmethod
+    def _compact(name, record):
+        record_type = RECORD_TYPES.get(name)
+        return record_type.from_api(record) if record_type is not None else record
+
+    def add(self, name, records):
+        """Store records in a collection; a call that stores nothing changes nothing."""
+
+        with self._lock:
+            collection = self._collections[name]
+            added = 0
+            for record in records:
+                key = self._key(name, record) if record else None
+                if key is not None:
+                    collection[key] = self._compact(name, record)
+                    added += 1
+            if not added:
+                return
+            self.revision += 1
+            if name in ReverseIndexes.COLLECTIONS:
+                self._indexes = None
+            if name == 'maps':
+                self._positions = None
+
+    def replace(self, name, records):
+        """Swap in the full contents of a collection and mark it complete."""
+
+        collection = {}
+        for record in records:
+            key = self._key(name, record)
+            if key is not None:
+                collection[key] = self._compact(name, record)
+
+        with self._lock:
+            self._collections[name] = collection
+            self.complete.add(name)
+            self.revision += 1
+            if name in ReverseIndexes.COLLECTIONS:
+                self._indexes = None
+            if name == 'maps':
+                self._positions = None
+
+    def clear(self):
+        with self._lock:
+            self.version = None
+            self.revision += 1
+            self.complete.clear()
+            self._collections = {name: {} for name in self.COLLECTIONS}
+            self._indexes = None
+            self._positions = None
+
+    def get(self, name, key):
+        return self._collections[name].get(key)
+
+    def records(self, name):
+        """All records of a complete collection, or None if it is not loaded in full."""
+
+        with self._lock:
+            if name not in self.complete:
+                return None
+            return list(self._collections[name].values())
+
+    def indexes(self):
+        """Reverse indexes over items, resources and monsters, or None until all three are complete."""
+
+        if not set(ReverseIndexes.COLLECTIONS) <= self.complete:
+            return None
+
+        if self._indexes is None:
+            self._indexes = ReverseIndexes(self)
+
+        return self._indexes
+
+    def add_items(self, items):
+        self.add('items', items)
+
+    def get_items(self, codes):
+        """Return ({code: item} for known codes, set of unknown codes)."""
+
+        with self._lock:
+            items = self._collections['items']
+            found = {code: items[code] for code in codes if code in items}
+
+        return found, set(codes) - found.keys()
+
+    def find_maps(self, content_type='', content_code='', layer=''):
+        """Map cells matching the /maps filters, or None if maps are not loaded in full."""
+
+        maps = self.records('maps')
+        if maps is None:
+            return None
+
+        return filter_maps(maps, content_type, content_code, layer)
+
+    def map_at(self, layer, x, y):
+        """The map cell at a position, or None if there is none or maps are not loaded in full."""
+
+        with self._lock:
+            if 'maps' not in self.complete:
+                return None
+
+            if self._positions is None:
+                self._positions = {
+                    (cell.get('layer'), cell.get('x'), cell.get('y')): cell
+                    for cell in self._collections['maps'].values()
+                }
+
+            return self._positions.get((layer, x, y))
+
+    def to_snapshot(self):
+        with self._lock:
+            return {
+                'version': self.version,
+                'collections': {
+                    name: [dict(record) for record in self._collections[name].values()]
+                    for name in sorted(self.complete)
+                },
+            }
+
+    def load_snapshot(self, snapshot):
+        self.clear()
+        for name, records in snapshot.get('collections', {}).items():
+            if name in self.COLLECTIONS:
+                self.replace(name, records)
+        self.version = snapshot.get('version')
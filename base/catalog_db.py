@@ -0,0 +1,211 @@
+import sqlite3
+import threading
+
+
+class CatalogDatabase:
+    """In-memory SQLite index over a complete Catalog.
+
+    Holds one row per record with the columns the API filters on, plus link
+    tables for recipes, drops and NPC trades, all indexed. ``select`` answers
+    the filtered list queries of the ``get_*`` fetchers locally and returns
+    the catalog's own record dicts in catalog order; ``query`` runs any SQL,
+    e.g. joins across collections.
+    """
+
+    SCHEMA = '''
+        CREATE TABLE items (
+            code TEXT PRIMARY KEY, name TEXT, level INTEGER, type TEXT,
+            craft_skill TEXT, craft_level INTEGER
+        );
+        CREATE INDEX items_level ON items (level);
+        CREATE INDEX items_type ON items (type, level);
+        CREATE INDEX items_craft ON items (craft_skill, level);
+
+        CREATE TABLE craft_materials (item_code TEXT, material_code TEXT, quantity INTEGER);
+        CREATE INDEX craft_materials_material ON craft_materials (material_code);
+        CREATE INDEX craft_materials_item ON craft_materials (item_code);
+
+        CREATE TABLE monsters (code TEXT PRIMARY KEY, name TEXT, level INTEGER);
+        CREATE INDEX monsters_level ON monsters (level);
+
+        CREATE TABLE monster_drops (
+            monster_code TEXT, item_code TEXT, rate INTEGER, min_quantity INTEGER, max_quantity INTEGER
+        );
+        CREATE INDEX monster_drops_item ON monster_drops (item_code);
+
+        CREATE TABLE resources (code TEXT PRIMARY KEY, name TEXT, skill TEXT, level INTEGER);
+        CREATE INDEX resources_skill ON resources (skill, level);
+
+        CREATE TABLE resource_drops (
+            resource_code TEXT, item_code TEXT, rate INTEGER, min_quantity INTEGER, max_quantity INTEGER
+        );
+        CREATE INDEX resource_drops_item ON resource_drops (item_code);
+
+        CREATE TABLE npcs (code TEXT PRIMARY KEY, name TEXT, type TEXT);
+        CREATE INDEX npcs_type ON npcs (type);
+
+        CREATE TABLE npc_items (
+            npc_code TEXT, item_code TEXT, currency TEXT, buy_price INTEGER, sell_price INTEGER
+        );
+        CREATE INDEX npc_items_currency ON npc_items (currency);
+        CREATE INDEX npc_items_item ON npc_items (item_code);
+
+        CREATE TABLE tasks (code TEXT PRIMARY KEY, level INTEGER, type TEXT, skill TEXT);
+        CREATE INDEX tasks_level ON tasks (level);
+        CREATE INDEX tasks_type ON tasks (type, skill);
+    '''
+
+    # Collection -> {API filter parameter: SQL condition on that collection's table}.
+    FILTERS = {
+        'items': {
+            'name': "items.name LIKE '%' || ? || '%'",
+            'min_level': 'items.level >= ?',
+            'max_level': 'items.level <= ?',
+            'type': 'items.type = ?',
+            'craft_skill': 'items.craft_skill = ?',
+            'craft_material': 'items.code IN (SELECT item_code FROM craft_materials WHERE material_code = ?)',
+        },
+        'monsters': {
+            'name': "monsters.name LIKE '%' || ? || '%'",
+            'min_level': 'monsters.level >= ?',
+            'max_level': 'monsters.level <= ?',
+            'drop': 'monsters.code IN (SELECT monster_code FROM monster_drops WHERE item_code = ?)',
+        },
+        'resources': {
+            'min_level': 'resources.level >= ?',
+            'max_level': 'resources.level <= ?',
+            'skill': 'resources.skill = ?',
+            'drop': 'resources.code IN (SELECT resource_code FROM resource_drops WHERE item_code = ?)',
+        },
+        'npcs': {
+            'name': "npcs.name LIKE '%' || ? || '%'",
+            'type': 'npcs.type = ?',
+            'currency': 'npcs.code IN (SELECT npc_code FROM npc_items WHERE currency = ?)',
+            'item': 'npcs.code IN (SELECT npc_code FROM npc_items WHERE item_code = ?)',
+        },
+        'tasks': {
+            'min_level': 'tasks.level >= ?',
+            'max_level': 'tasks.level <= ?',
+            'skill': 'tasks.skill = ?',
+            'type': 'tasks.type = ?',
+        },
+    }
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.revision = catalog.revision
+        self.connection = sqlite3.connect(':memory:', check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock:
+            self.connection.executescript(self.SCHEMA)
+            self._fill()
+
+    def _fill(self):
+        items = self.catalog.records('items') or []
+        self.connection.executemany(
+            'INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?)',
+            [
+                (item['code'], item.get('name'), item.get('level'), item.get('type'),
+                 (item.get('craft') or {}).get('skill'), (item.get('craft') or {}).get('level'))
+                for item in items
+            ],
+        )
+        self.connection.executemany(
+            'INSERT INTO craft_materials VALUES (?, ?, ?)',
+            [
+                (item['code'], material.get('code'), material.get('quantity'))
+                for item in items
+                for material in (item.get('craft') or {}).get('items') or []
+            ],
+        )
+
+        monsters = self.catalog.records('monsters') or []
+        self.connection.executemany(
+            'INSERT OR REPLACE INTO monsters VALUES (?, ?, ?)',
+            [(monster['code'], monster.get('name'), monster.get('level')) for monster in monsters],
+        )
+        self.connection.executemany('INSERT INTO monster_drops VALUES (?, ?, ?, ?, ?)', self._drop_rows(monsters))
+
+        resources = self.catalog.records('resources') or []
+        self.connection.executemany(
+            'INSERT OR REPLACE INTO resources VALUES (?, ?, ?, ?)',
+            [(resource['code'], resource.get('name'), resource.get('skill'), resource.get('level'))
+             for resource in resources],
+        )
+        self.connection.executemany('INSERT INTO resource_drops VALUES (?, ?, ?, ?, ?)', self._drop_rows(resources))
+
+        self.connection.executemany(
+            'INSERT OR REPLACE INTO npcs VALUES (?, ?, ?)',
+            [(npc['code'], npc.get('name'), npc.get('type')) for npc in self.catalog.records('npcs') or []],
+        )
+        self.connection.executemany(
+            'INSERT INTO npc_items VALUES (?, ?, ?, ?, ?)',
+            [
+                (entry.get('npc'), entry.get('code'), entry.get('currency'),
+                 entry.get('buy_price'), entry.get('sell_price'))
+                for entry in self.catalog.records('npc_items') or []
+            ],
+        )
+        self.connection.executemany(
+            'INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?)',
+            [
+                (task['code'], task.get('level'), task.get('type'), task.get('skill'))
+                for task in self.catalog.records('tasks') or []
+            ],
+        )
+        self.connection.commit()
+
+    @staticmethod
+    def _drop_rows(records):
+        return [
+            (record['code'], drop.get('code'), drop.get('rate'), drop.get('min_quantity'), drop.get('max_quantity'))
+            for record in records
+            for drop in record.get('drops') or []
+        ]
+
+    def query(self, sql, params=()):
+        with self._lock:
+            return self.connection.execute(sql, params).fetchall()
+
+    def select(self, name, params):
+        """Records of collection name matching the API filter params.
+
+        Returns None when a filter has no local equivalent, so the caller
+        can fall back to the API.
+        """
+
+        filters = self.FILTERS.get(name)
+        if filters is None or any(key not in filters for key in params):
+            return None
+
+        conditions = [filters[key] for key in params] or ['1']
+        sql = f'SELECT code FROM {name} WHERE {" AND ".join(conditions)} ORDER BY rowid'
+        rows = self.query(sql, tuple(params.values()))
+
+        return [self.catalog.get(name, code) for code, in rows]
+
+    def craftable_from_monster_drops(self, craft_skill, craft_level, monster_level):
+        """Items of craft_skill up to craft_level whose materials all drop from
+        monsters of at most monster_level."""
+
+        rows = self.query(
+            '''
+            SELECT items.code FROM items
+            WHERE items.craft_skill = ? AND items.craft_level <= ?
+              AND EXISTS (SELECT 1 FROM craft_materials WHERE item_code = items.code)
+              AND NOT EXISTS (
+                  SELECT 1 FROM craft_materials
+                  WHERE craft_materials.item_code = items.code
+                    AND craft_materials.material_code NOT IN (
+                        SELECT monster_drops.item_code FROM monster_drops
+                        JOIN monsters ON monsters.code = monster_drops.monster_code
+                        WHERE monsters.level <= ?
+                    )
+              )
+            ORDER BY items.rowid
+            ''',
+            (craft_skill, craft_level, monster_level),
+        )
+
+        return [self.catalog.get('items', code) for code, in rows]
@@ -1,46 +1,46 @@
-from time import sleep
+import threading
+from collections import deque
+from math import ceil
+from time import monotonic, sleep
 
+from base import deadline
 from base.base import BaseGameClient
+from base.character_state import CharacterState
+from base.codec import parse_http_date, parse_time
 from base.enums import ItemTypesEnum
+from base.inventory import InventoryIndex
 
 
 class Character(BaseGameClient):
-    """Client for character-level interaction."""
-
-    CHARACTER_INFO_FIELDS = (
-        'name', 'account', 'skin', 'level', 'xp', 'max_xp', 'gold',
-        'mining_level', 'mining_xp', 'mining_max_xp',
-        'woodcutting_level', 'woodcutting_xp', 'woodcutting_max_xp',
-        'fishing_level', 'fishing_xp', 'fishing_max_xp',
-        'weaponcrafting_level', 'weaponcrafting_xp', 'weaponcrafting_max_xp',
-        'gearcrafting_level', 'gearcrafting_xp', 'gearcrafting_max_xp',
-        'jewelrycrafting_level', 'jewelrycrafting_xp', 'jewelrycrafting_max_xp',
-        'cooking_level', 'cooking_xp', 'cooking_max_xp',
-        'alchemy_level', 'alchemy_xp', 'alchemy_max_xp',
-        'hp', 'max_hp', 'haste', 'critical_strike', 'wisdom', 'prospecting',
-        'initiative', 'threat',
-        'attack_fire', 'attack_earth', 'attack_water', 'attack_air',
-        'dmg', 'dmg_fire', 'dmg_earth', 'dmg_water', 'dmg_air',
-        'res_fire', 'res_earth', 'res_water', 'res_air',
-        'effects',
-        'x', 'y', 'layer', 'map_id',
-        'cooldown', 'cooldown_expiration',
-        'weapon_slot', 'shield_slot', 'helmet_slot', 'body_armor_slot',
-        'leg_armor_slot', 'boots_slot', 'ring1_slot', 'ring2_slot',
-        'amulet_slot', 'artifact1_slot', 'artifact2_slot', 'artifact3_slot',
-        'rune_slot', 'utility1_slot', 'utility1_slot_quantity',
-        'utility2_slot', 'utility2_slot_quantity', 'bag_slot',
-        'task', 'task_type', 'task_progress', 'task_total',
-        'inventory_max_items', 'inventory',
-    )
+    """Client for character-level interaction.
+
+    The API fields (``hp``, ``x``, ``inventory``, ...) live in a slotted
+    CharacterState, ``self.state``, and read as plain attributes. Each
+    update reports only the fields it changed to the display and to the
+    callbacks registered with ``subscribe``. ``inventory_index`` follows
+    the inventory and answers item quantities and fill without a scan.
+    """
+
+    CONFIG_ACTION_LOG_KEY = 'ACTION_LOG'
+
+    CHARACTER_INFO_FIELDS = CharacterState.FIELDS
 
     def __init__(self, name, parent=None, display=None) -> None:
-        super().__init__()
+        self.state = CharacterState()
+        self.inventory_index = InventoryIndex()
+        self._subscribers = []
+        self._subscribers_lock = threading.Lock()
+        super().__init__(parent=parent)
 
         self.name = name
         self.parent = parent
         self.display = display
         self.base_character_action_url = f'/my/{self.name}/action'
+        self._ready_at = 0.0
+        self._acted = False
+        self._action_lock = threading.RLock()
+        self._queue = deque()
+        self._queue_lock = threading.Lock()
         self.refresh()
 
     def _get_with_reauth(self, url, data=None):
@@ -93,13 +93,89 @@ class Character(BaseGameClient):
     def _get_character_info(self):
         response = self._get_with_reauth(url=f'/characters/{self.name}')
         if response.status_code != 200:
-            if error_block := response.json().get('error'):
+            if error_block := response.error:
                 self.display.print(error_block.get('message', 'Unknown error.'))
             return
 
-        for key in self.CHARACTER_INFO_FIELDS:
-            if key in response.json().get('data', {}):
-                setattr(self, key, response.json()['data'][key])
+        self._apply_character_data(response.data or {}, parse_http_date(response.headers.get('Date')))
+
+    def _apply_character_data(self, data, server_now=None):
+        """Take a character block from the API (e.g. from an action response).
+
+        ``cooldown_expiration`` is a server clock time. It only sets the
+        cooldown when ``server_now``, the server's clock at the time of the
+        response (its ``Date`` header), is given, so the local clock's skew
+        never adds to the wait. Action responses set the cooldown from
+        their ``remaining_seconds`` instead.
+
+        Returns the StateChanges, which are also passed to the display and
+        to every subscriber when not empty.
+        """
+
+        changes = self.state.update(data)
+        if 'inventory' in changes:
+            self.inventory_index.update(self.state.inventory, getattr(self.state, 'inventory_max_items', None))
+
+        expires_at = parse_time(data.get('cooldown_expiration'))
+        if expires_at is not None and server_now is not None:
+            left = (expires_at - server_now).total_seconds()
+            self._ready_at = max(self._ready_at, monotonic() + left)
+
+        if changes:
+            if self.display is not None:
+                self.display.show_character_changes(self, changes)
+            with self._subscribers_lock:
+                subscribers = list(self._subscribers)
+            for callback in subscribers:
+                callback(self, changes)
+
+        return changes
+
+    def subscribe(self, callback):
+        """Call callback(character, changes) after every update that changed something."""
+
+        with self._subscribers_lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        with self._subscribers_lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def cooldown_remaining(self):
+        """Seconds until the character can act again, 0 when it already can."""
+
+        return max(0.0, self._ready_at - monotonic())
+
+    def wait_for_cooldown(self):
+        """Block until the cooldown of the previous action is over, showing the countdown.
+
+        Inside a ``deadline()`` that ends before the cooldown does,
+        DeadlineExceeded is raised at once instead of waiting in vain.
+        """
+
+        remaining = self.cooldown_remaining()
+        if remaining <= 0:
+            return
+
+        budget = deadline.remaining()
+        if budget is not None and budget < remaining:
+            raise deadline.DeadlineExceeded('cooldown outlasts the deadline')
+
+        while remaining > 0:
+            self.display.show_action_countdown(ceil(remaining))
+            sleep(min(1, remaining))
+            remaining = self.cooldown_remaining()
+
+        self.display.clear_action_countdown()
+
+    def _start_cooldown(self, cooldown):
+        remaining = cooldown.get('remaining_seconds', cooldown.get('total_seconds', 0))
+        self._ready_at = monotonic() + remaining
+        self._acted = True
+        if cooldown.get('expiration'):
+            self.cooldown_expiration = cooldown['expiration']
 
     def _get_last_action(self):
         last_action_data = self._get_with_reauth(
@@ -111,47 +187,125 @@ class Character(BaseGameClient):
         )
 
         if last_action_data.status_code == 200:
-            logs = last_action_data.json().get('data', [])
+            logs = last_action_data.data or []
             if logs:
                 log = logs[0]
                 self.display.show_action_log(log.get('description', ''))
                 self.display.show_action_details(log)
             else:
                 self.display.print('No recent actions.')
-        elif error_block := last_action_data.json().get('error'):
+        elif error_block := last_action_data.error:
             self.display.print(f'Can\'t get last action. {error_block.get("message", "Unknown error.")}.')
 
-        self.refresh()
+    def _character_block(self, data):
+        """This character's block in an action response, or None if it has none."""
+
+        if data.get('character'):
+            return data['character']
+
+        for character in data.get('characters') or []:
+            if character.get('name') == self.name:
+                return character
+
+        return None
+
+    @staticmethod
+    def _describe_action(reason, data):
+        description = reason.replace('_', ' ').capitalize()
+        result = (data.get('fight') or {}).get('result')
+
+        return f'{description}: {result}.' if result else f'{description} done.'
 
     def _do_action(self, action_name='', action_data=None):
+        """Send an action once the previous one's cooldown is over.
+
+        Returns as soon as the server has answered; the new cooldown is
+        only waited for by the next action, so the caller is free in the
+        meantime. Actions of one character run one at a time.
+        """
+
         if action_data is None:
             action_data = {}
 
         url = f'{self.base_character_action_url}/{action_name}'
-        action_request = self._post_with_reauth(url=url, data=action_data)
-        result = self._handle_action_response(action_request, action_name)
+        with self._action_lock:
+            self.wait_for_cooldown()
+            idle = monotonic() - self._ready_at if self._acted else None
+            action_request = self._post_with_reauth(url=url, data=action_data)
+            if idle is not None:
+                self.metrics.record_idle('POST', url, idle)
+            result = self._handle_action_response(action_request, action_name)
 
         return result
 
+    def enqueue(self, action, *args, **kwargs):
+        """Queue an action for run_queue, e.g. ``enqueue('move', 2, 0)``. Returns self, so calls chain."""
+
+        if action.startswith('_') or not callable(getattr(self, action, None)):
+            raise ValueError(f'Unknown action: {action}')
+
+        with self._queue_lock:
+            self._queue.append((action, args, kwargs))
+        return self
+
+    def _take_queue(self):
+        """Detach the queued actions for one run; anything queued later waits for the next run."""
+
+        with self._queue_lock:
+            queue, self._queue = self._queue, deque()
+        return queue
+
+    def run_queue(self, stop_on_failure=True):
+        """Run the queued actions in order, each sent the moment the previous cooldown ends.
+
+        The actions run back to back under the action lock, with no other
+        work between the end of one cooldown and the next request; the
+        idle gaps show up in ``metrics``. By default the first action that
+        fails ends the run and drops the rest, as they usually depend on
+        it; with ``stop_on_failure=False`` the others still run, for
+        independent steps such as one deposit per item. An action that
+        raises always ends the run. Actions queued once the run has
+        started, e.g. from another thread, are kept for the next one.
+        Returns the results of the actions that succeeded.
+        """
+
+        queue = self._take_queue()
+        results = []
+        with self._action_lock:
+            while queue:
+                action, args, kwargs = queue.popleft()
+                result = getattr(self, action)(*args, **kwargs)
+                if result:
+                    results.append(result)
+                elif stop_on_failure:
+                    break
+
+        return results
+
     def _handle_action_response(self, action_request, action_name):
         result = None
 
         if action_request.status_code == 200:
-            data = action_request.json().get('data', {})
+            data = action_request.data or {}
             cooldown = data.get('cooldown', {})
             reason = cooldown.get('reason', action_name)
             total_seconds = cooldown.get('total_seconds', 0)
-            self.display.show_action_in_progress(reason, total_seconds)
+            self._start_cooldown(cooldown)
 
-            for i in range(total_seconds, 0, -1):
-                self.display.show_action_countdown(i)
-                sleep(1)
+            character = self._character_block(data)
+            if character is not None:
+                self._apply_character_data(character)
+            else:
+                self.refresh()
 
-            self.display.clear_action_countdown()
+            self.display.show_action_in_progress(reason, total_seconds)
             self.display.show_action_details(data)
-            self._get_last_action()
+            if self.config.getboolean(self.CONFIG_SECTION, self.CONFIG_ACTION_LOG_KEY, fallback=False):
+                self._get_last_action()
+            else:
+                self.display.show_action_log(self._describe_action(reason, data))
             result = data
-        elif error_block := action_request.json().get('error'):
+        elif error_block := action_request.error:
             self.display.show_action_error(error_block.get("message", "Unknown error."))
 
         return result
@@ -188,7 +342,7 @@ class Character(BaseGameClient):
         if response.status_code != 200:
             return None
 
-        map_data = response.json().get('data', {})
+        map_data = response.data or {}
         content = map_data.get('interactions', {}).get('content', {})
         if content.get('type') != 'resource':
             return None
@@ -201,7 +355,21 @@ class Character(BaseGameClient):
         if resource_response.status_code != 200:
             return None
 
-        return resource_response.json().get('data', {}).get('skill')
+        return (resource_response.data or {}).get('skill')
+
+    def _get_items_by_codes(self, codes):
+        """Item data for many codes, through the account client's catalog when there is one."""
+
+        if self.parent is not None and hasattr(self.parent, 'get_items_by_codes'):
+            return self.parent.get_items_by_codes(codes)
+
+        items = {}
+        for code in {code for code in codes if code}:
+            response = self._get(url=f'/items/{code}')
+            if response.status_code == 200:
+                items[code] = response.data or {}
+
+        return items
 
     def _equip_best_gathering_weapon(self, skill_code):
         if not skill_code:
@@ -211,16 +379,14 @@ class Character(BaseGameClient):
         best_code = None
         best_value = 0
 
-        for slot in self.inventory or []:
-            code = slot.get('code')
-            if not code or code == current_weapon:
-                continue
+        codes = set(self.inventory_index.codes())
+        items = self._get_items_by_codes(codes | {current_weapon})
 
-            item_response = self._get(url=f'/items/{code}')
-            if item_response.status_code != 200:
+        for code in codes:
+            if not code or code == current_weapon:
                 continue
 
-            item = item_response.json().get('data', {})
+            item = items.get(code, {})
             if item.get('type') != 'weapon':
                 continue
 
@@ -236,14 +402,10 @@ class Character(BaseGameClient):
             return
 
         current_value = 0
-        if current_weapon:
-            item_response = self._get(url=f'/items/{current_weapon}')
-            if item_response.status_code == 200:
-                current_item = item_response.json().get('data', {})
-                for effect in current_item.get('effects') or []:
-                    if effect.get('code') == skill_code:
-                        current_value = abs(effect.get('value', 0))
-                        break
+        for effect in items.get(current_weapon, {}).get('effects') or []:
+            if effect.get('code') == skill_code:
+                current_value = abs(effect.get('value', 0))
+                break
 
         if best_value > current_value:
             self.display.print(f'Equipping {best_code} (+{best_value} {skill_code})...')
@@ -258,27 +420,18 @@ class Character(BaseGameClient):
         return self._do_action('gathering')
 
     def _deposit_non_equip_if_full(self):
-        inventory = getattr(self, 'inventory', None) or []
-        max_items = getattr(self, 'inventory_max_items', 100)
-        total_quantity = sum(s.get('quantity', 0) for s in inventory if s.get('code'))
-        fill_ratio = total_quantity / max_items if max_items else 0
-
-        if fill_ratio > 0.9:
-            unique_codes = set()
-            for entry in inventory:
-                code = entry.get('code')
-                if code:
-                    unique_codes.add(code)
+        inventory = self.inventory_index
+
+        if inventory.fill_ratio > 0.9:
+            total_quantity, max_items = inventory.total, inventory.max_items
+            unique_codes = set(inventory.codes())
 
             equip_types = set(ItemTypesEnum.EQUIP_TYPES)
             codes_to_deposit = []
 
-            for code in unique_codes:
-                response = self._get(url=f'/items/{code}')
-                if response.status_code == 200:
-                    item_type = response.json().get('data', {}).get('type')
-                    if item_type not in equip_types:
-                        codes_to_deposit.append(code)
+            for code, item in self._get_items_by_codes(unique_codes).items():
+                if item.get('type') not in equip_types:
+                    codes_to_deposit.append(code)
 
             if codes_to_deposit:
                 origin_x, origin_y = self.x, self.y
@@ -286,26 +439,20 @@ class Character(BaseGameClient):
 
                 location = self._get(url=f'/maps/{self.layer}/{self.x}/{self.y}')
                 if location.status_code == 200:
-                    content_type = (location.json().get('data', {}).get('content') or {}).get('type')
+                    content_type = ((location.data or {}).get('content') or {}).get('type')
                     at_bank = content_type == 'bank'
 
                 if not at_bank:
                     banks = self._get(url='/maps', data={'content_type': 'bank', 'layer': self.layer, 'size': 100})
                     if banks.status_code == 200:
-                        bank_list = banks.json().get('data', [])
+                        bank_list = banks.data or []
                         if bank_list:
                             bank = bank_list[0]
                             self.display.print(f'Moving to bank ({bank["x"]}, {bank["y"]}) to deposit...')
                             self.move(bank['x'], bank['y'])
 
-                inv_by_code = {}
-                for entry in (getattr(self, 'inventory', None) or []):
-                    c = entry.get('code')
-                    if c:
-                        inv_by_code[c] = inv_by_code.get(c, 0) + entry.get('quantity', 0)
-
                 self.display.print(f'Inventory {total_quantity}/{max_items} (>90%). Depositing...')
-                deposit_list = [(code, inv_by_code.get(code, 0)) for code in codes_to_deposit if inv_by_code.get(code, 0) > 0]
+                deposit_list = [(code, inventory.quantity(code)) for code in codes_to_deposit if code in inventory]
                 if deposit_list:
                     self.deposit_items(deposit_list)
 
@@ -431,3 +578,17 @@ class Character(BaseGameClient):
 
     def npc_sell(self, code='', quantity=1):
         return self._do_action('npc/sell', {'code': code, 'quantity': quantity})
+
+
+def _state_property(field):
+    def getter(self):
+        return getattr(self.state, field)
+
+    def setter(self, value):
+        setattr(self.state, field, value)
+
+    return property(getter, setter)
+
+
+for _field in CharacterState.FIELDS:
+    setattr(Character, _field, _state_property(_field))
@@ -0,0 +1,133 @@
+from base.enums import CraftSkillEnum, EquipmentSlotsEnum, GatheringSkillEnum
+
+_UNSET = object()
+
+
+def _invert(groups):
+    result = {}
+    for group, fields in groups.items():
+        for field in fields:
+            result[field] = result.get(field, ()) + (group,)
+
+    return result
+
+
+class StateChanges:
+    """The fields one update of a CharacterState changed.
+
+    ``fields`` holds the changed field names and ``groups`` the groups they
+    belong to (``'hp'``, ``'inventory'``, ``'position'``, ...). ``name in
+    changes`` accepts either. ``old`` maps each changed field to its
+    previous value; fields seen for the first time are not in it.
+    """
+
+    __slots__ = ('fields', 'groups', 'old')
+
+    def __init__(self, old, fields):
+        self.fields = frozenset(fields)
+        self.groups = frozenset(
+            group for field in self.fields for group in CharacterState.FIELD_GROUPS.get(field, ())
+        )
+        self.old = old
+
+    def __contains__(self, name):
+        return name in self.fields or name in self.groups
+
+    def __bool__(self):
+        return bool(self.fields)
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __repr__(self):
+        return f'StateChanges({sorted(self.fields)!r})'
+
+
+class CharacterState:
+    """Slotted copy of a character's API fields.
+
+    ``update`` takes a character block from the API and returns the
+    StateChanges it caused, so displays and scenarios can react to those
+    fields only. Fields not received yet are unset and raise AttributeError.
+    """
+
+    FIELDS = (
+        'name', 'account', 'skin', 'level', 'xp', 'max_xp', 'gold',
+        'mining_level', 'mining_xp', 'mining_max_xp',
+        'woodcutting_level', 'woodcutting_xp', 'woodcutting_max_xp',
+        'fishing_level', 'fishing_xp', 'fishing_max_xp',
+        'weaponcrafting_level', 'weaponcrafting_xp', 'weaponcrafting_max_xp',
+        'gearcrafting_level', 'gearcrafting_xp', 'gearcrafting_max_xp',
+        'jewelrycrafting_level', 'jewelrycrafting_xp', 'jewelrycrafting_max_xp',
+        'cooking_level', 'cooking_xp', 'cooking_max_xp',
+        'alchemy_level', 'alchemy_xp', 'alchemy_max_xp',
+        'hp', 'max_hp', 'haste', 'critical_strike', 'wisdom', 'prospecting',
+        'initiative', 'threat',
+        'attack_fire', 'attack_earth', 'attack_water', 'attack_air',
+        'dmg', 'dmg_fire', 'dmg_earth', 'dmg_water', 'dmg_air',
+        'res_fire', 'res_earth', 'res_water', 'res_air',
+        'effects',
+        'x', 'y', 'layer', 'map_id',
+        'cooldown', 'cooldown_expiration',
+        'weapon_slot', 'shield_slot', 'helmet_slot', 'body_armor_slot',
+        'leg_armor_slot', 'boots_slot', 'ring1_slot', 'ring2_slot',
+        'amulet_slot', 'artifact1_slot', 'artifact2_slot', 'artifact3_slot',
+        'rune_slot', 'utility1_slot', 'utility1_slot_quantity',
+        'utility2_slot', 'utility2_slot_quantity', 'bag_slot',
+        'task', 'task_type', 'task_progress', 'task_total',
+        'inventory_max_items', 'inventory',
+    )
+    __slots__ = FIELDS
+
+    GROUPS = {
+        'hp': ('hp', 'max_hp'),
+        'xp': ('level', 'xp', 'max_xp'),
+        'skills': tuple(
+            f'{skill}_{suffix}'
+            for skill in dict.fromkeys([*GatheringSkillEnum, *CraftSkillEnum])
+            for suffix in ('level', 'xp', 'max_xp')
+        ),
+        'gold': ('gold',),
+        'stats': (
+            'max_hp', 'haste', 'critical_strike', 'wisdom', 'prospecting', 'initiative', 'threat',
+            'attack_fire', 'attack_earth', 'attack_water', 'attack_air',
+            'dmg', 'dmg_fire', 'dmg_earth', 'dmg_water', 'dmg_air',
+            'res_fire', 'res_earth', 'res_water', 'res_air', 'effects',
+        ),
+        'position': ('x', 'y', 'layer', 'map_id'),
+        'equipment': tuple(f'{slot}_slot' for slot in EquipmentSlotsEnum) + (
+            'utility1_slot_quantity', 'utility2_slot_quantity',
+        ),
+        'inventory': ('inventory', 'inventory_max_items'),
+        'task': ('task', 'task_type', 'task_progress', 'task_total'),
+        'cooldown': ('cooldown', 'cooldown_expiration'),
+        'appearance': ('name', 'skin'),
+    }
+
+    # Field -> the groups it belongs to.
+    FIELD_GROUPS = _invert(GROUPS)
+
+    def update(self, data):
+        """Take the fields present in data. Returns the StateChanges."""
+
+        old = {}
+        fields = []
+        for field in self.FIELDS:
+            if field not in data:
+                continue
+
+            value = data[field]
+            previous = getattr(self, field, _UNSET)
+            if previous is _UNSET or previous != value:
+                setattr(self, field, value)
+                fields.append(field)
+                if previous is not _UNSET:
+                    old[field] = previous
+
+        return StateChanges(old, fields)
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS if hasattr(self, field)}
@@ -1,8 +1,18 @@
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import requests
+
+from base import deadline, snapshot
 from base.base import BaseGameClient
+from base.catalog import Catalog
+from base.catalog_db import CatalogDatabase
 from base.character import Character
 from base.enums import ActionTypeEnum, CharacterSexEnum
+from base.leaderboard import LeaderboardCursor
+from base.map_cache import MapCache
+from base.map_sync import MapSyncService
 
 
 class GameClient(BaseGameClient):
@@ -12,6 +22,14 @@ class GameClient(BaseGameClient):
     action routing maps used by both console and GUI front-ends.
     """
 
+    CONFIG_CATALOG_SNAPSHOT_KEY = 'CATALOG_SNAPSHOT'
+    CONFIG_CATALOG_SQLITE_KEY = 'CATALOG_SQLITE'
+    CONFIG_CATALOG_WARMUP_KEY = 'CATALOG_WARMUP'
+    CONFIG_MAP_SYNC_INTERVAL_KEY = 'MAP_SYNC_INTERVAL'
+
+    # Collections the first menus need, prefetched while the user logs in.
+    WARMUP_COLLECTIONS = ('maps', 'items', 'resources', 'monsters', 'effects')
+
     def __init__(self, display=None):
         super().__init__()
 
@@ -19,6 +37,16 @@ class GameClient(BaseGameClient):
         self.character = None
         self.characters = []
         self.scenarios_storage = None
+        self.catalog = Catalog()
+        self.catalog_refresh = None
+        self.catalog_warmup = None
+        self.catalog_db = None
+        self.map_cache = MapCache(self.catalog)
+        self.map_sync = MapSyncService(
+            self, self.config.getfloat(self.CONFIG_SECTION, self.CONFIG_MAP_SYNC_INTERVAL_KEY, fallback=60),
+        )
+        if self._catalog_snapshot_enabled():
+            self._load_catalog_snapshot()
 
         self.main_menu_map = {
             ActionTypeEnum.MOVE: self.character_movement,
@@ -134,18 +162,15 @@ class GameClient(BaseGameClient):
         result = []
 
         if response.status_code == 200:
-            result = response.json().get('data', [])
+            result = response.data or []
         else:
             self._print_error_silently(response)
 
         return result
 
     def _print_error_silently(self, response):
-        try:
-            if error_block := response.json().get('error'):
-                self.display.print(error_block.get('message', 'Unknown error.'))
-        except ValueError:
-            pass
+        if error_block := response.error:
+            self.display.print(error_block.get('message', 'Unknown error.'))
 
     def create_character(self, name, sex):
         """Create a new character. Returns True on success."""
@@ -163,7 +188,7 @@ class GameClient(BaseGameClient):
             self.display.print(f'Character {name} successfully created.')
             return True
 
-        if error_block := create_request.json().get('error'):
+        if error_block := create_request.error:
             self.display.print(error_block.get('message', 'Unknown error.'))
 
         return False
@@ -176,7 +201,7 @@ class GameClient(BaseGameClient):
             self.display.print('Failed to get account details.')
             return None
 
-        data = response.json().get('data', {})
+        data = response.data or {}
         return data
 
     def login_with_password(self):
@@ -200,10 +225,166 @@ class GameClient(BaseGameClient):
                 self.display.print('Can\'t reach the server. Please try again later.')
             return
 
-        data = response.json().get('data', {})
+        data = response.data or {}
         if self.display:
             self.display.print(f'Game version: {data.get("version", "?")}.')
 
+        self.sync_catalog(data.get('version'))
+
+    # ── Game-data catalog ───────────────────────────────────────
+
+    def _catalog_snapshot_enabled(self):
+        return self.config.getboolean(self.CONFIG_SECTION, self.CONFIG_CATALOG_SNAPSHOT_KEY, fallback=True)
+
+    def _load_catalog_snapshot(self):
+        data = snapshot.load_latest()
+        if data:
+            self.catalog.load_snapshot(data)
+            self._build_catalog_db()
+
+    def _build_catalog_db(self):
+        """Index the catalog in SQLite when CATALOG_SQLITE is on and every collection is loaded."""
+
+        enabled = self.config.getboolean(self.CONFIG_SECTION, self.CONFIG_CATALOG_SQLITE_KEY, fallback=False)
+        if enabled and self.catalog.complete == set(Catalog.COLLECTIONS):
+            self.catalog_db = CatalogDatabase(self.catalog)
+        else:
+            self.catalog_db = None
+
+    def warm_up_catalog(self):
+        """Prefetch WARMUP_COLLECTIONS in a background thread, which is returned.
+
+        The front-ends start it first thing once their UI is up, so maps,
+        items, resources, monsters and effects download in parallel while the
+        user is still at the login or account menu. Collections already
+        loaded from a snapshot are skipped; returns None when there is
+        nothing to fetch, CATALOG_WARMUP is off or it is already running.
+        """
+
+        if self.catalog_warmup is not None or not self._catalog_snapshot_enabled():
+            return None
+
+        if not self.config.getboolean(self.CONFIG_SECTION, self.CONFIG_CATALOG_WARMUP_KEY, fallback=True):
+            return None
+
+        names = [name for name in self.WARMUP_COLLECTIONS if name not in self.catalog.complete]
+        if not names:
+            return None
+
+        self.catalog_warmup = threading.Thread(
+            target=deadline.bind(self._fetch_catalog), args=(names,),
+            name='artifacts-catalog-warmup', daemon=True,
+        )
+        self.catalog_warmup.start()
+
+        return self.catalog_warmup
+
+    def sync_catalog(self, version):
+        """Bring the catalog in line with the server's game version.
+
+        A snapshot of the same version is kept as is. A snapshot of another
+        version is dropped, so its data never answers a query. Whatever is
+        missing is then fetched in a background thread, which is returned.
+        """
+
+        if not version or not self._catalog_snapshot_enabled():
+            return None
+
+        if self.catalog.version == version and self.catalog.complete == set(Catalog.COLLECTIONS):
+            return None
+
+        if self.catalog.version not in (None, version):
+            self.catalog.clear()
+            self.catalog_db = None
+
+        self.catalog_refresh = threading.Thread(
+            target=deadline.bind(self.refresh_catalog), args=(version,),
+            name='artifacts-catalog', daemon=True,
+        )
+        self.catalog_refresh.start()
+
+        return self.catalog_refresh
+
+    def refresh_catalog(self, version):
+        """Download the collections the catalog is missing and save it as the snapshot for version.
+
+        Collections fetched by the warm-up are live data and are kept, so
+        this waits for it and only downloads the rest.
+        """
+
+        if self.catalog_warmup is not None and self.catalog_warmup is not threading.current_thread():
+            self.catalog_warmup.join()
+
+        names = [name for name in Catalog.COLLECTIONS if name not in self.catalog.complete]
+        if names and not self._fetch_catalog(names):
+            return False
+
+        self.catalog.version = version
+        self._build_catalog_db()
+
+        try:
+            snapshot.save(self.catalog.to_snapshot())
+        except OSError:
+            pass
+
+        return True
+
+    def _fetch_catalog(self, names):
+        """Download the named collections in parallel into the catalog.
+
+        Runs in the background, so the requests skip the loading indicator
+        and the re-login prompt. Each collection is stored as soon as it
+        arrives and reported through ``display.show_catalog_progress``. A
+        collection with a failed page, or whose download raised (connection
+        lost, timeout, deadline), is left out rather than stored incomplete.
+        Returns True if all of them arrived.
+        """
+
+        missing = []
+        with ThreadPoolExecutor(max_workers=len(names), thread_name_prefix='artifacts-catalog') as executor:
+            futures = {
+                executor.submit(deadline.bind(self._get_all_pages), Catalog.COLLECTIONS[name], {}, strict=True, quiet=True): name
+                for name in names
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                name = futures[future]
+                try:
+                    records = future.result()
+                except (requests.exceptions.RequestException, ValueError, deadline.DeadlineExceeded):
+                    records = None
+                if records is not None:
+                    self.catalog.replace(name, records)
+                else:
+                    missing.append(name)
+                if self.display:
+                    self.display.show_catalog_progress(name, done, len(names))
+
+        return not missing
+
+    def _catalog_records(self, name, params):
+        """Answer a list query from the catalog, or return None to use the API.
+
+        Unfiltered queries need the collection loaded in full. Items by
+        craft material come from the catalog's reverse indexes; other
+        filtered queries need the SQLite index (CATALOG_SQLITE).
+        """
+
+        if not params:
+            return self.catalog.records(name)
+
+        if name == 'items' and set(params) == {'craft_material'}:
+            indexes = self.catalog.indexes()
+            if indexes is not None:
+                return [self.catalog.get('items', code) for code in indexes.consumer_codes(params['craft_material'])]
+
+        if self.catalog_db is not None and self.catalog_db.revision != self.catalog.revision:
+            self._build_catalog_db()
+
+        if self.catalog_db is not None and name in self.catalog.complete:
+            return self.catalog_db.select(name, params)
+
+        return None
+
     # ── Menu dispatch stubs (overridden by subclasses) ──────────
 
     def character_movement(self):
@@ -326,16 +507,81 @@ class GameClient(BaseGameClient):
     # ── API data fetchers ───────────────────────────────────────
 
     def get_location_data(self, layer='overworld', x=0, y=0):
+        if self._sync_map_events():
+            cell = self.map_cache.at(layer, x, y)
+            if cell is not None:
+                return cell
+
         location_data = self._get_with_reauth(url=f'/maps/{layer}/{x}/{y}')
         if location_data.status_code == 200:
-            return location_data.json().get('data', {})
+            return location_data.data or {}
 
-        if error_block := location_data.json().get('error'):
+        if error_block := location_data.error:
             self.display.print(error_block.get('message', 'Unknown error.'))
 
         return {}
 
     def get_maps_data(self, content_type='', content_code='', layer=''):
+        if self._sync_map_events():
+            return self.map_cache.find(content_type, content_code, layer)
+
+        params = self._maps_params(content_type, content_code, layer)
+
+        return self._get_all_pages('/maps', params, default=[])
+
+    def _sync_map_events(self, force=False, quiet=False):
+        """Bring the event cells of the map cache up to date so map reads can be served from memory.
+
+        Asks /events/active again once EVENTS_MAX_AGE has passed (or when
+        forced) and restores the cells of events that have ended, one
+        request per cell at most. ``quiet`` is for background pollers, see
+        _get_all_pages. Returns False while maps are not loaded in full.
+        """
+
+        if 'maps' not in self.catalog.complete:
+            return False
+
+        if force or self.map_cache.events_stale():
+            self._get_active_events(quiet)
+        self._restore_map_cells(self.map_cache.expire(), quiet)
+
+        return True
+
+    def _restore_map_cells(self, ended, quiet=False):
+        get = self._get if quiet else self._get_with_reauth
+        cells = []
+        for map_id, cell in ended.items():
+            if cell is None:
+                response = get(url=f'/maps/id/{map_id}')
+                cell = response.data if response.status_code == 200 else None
+            if cell:
+                cells.append(cell)
+        if cells:
+            self.catalog.add('maps', cells)
+
+    def start_map_sync(self):
+        """Start the background map sync and route its changes to the display.
+
+        Polls every MAP_SYNC_INTERVAL seconds (0 turns it off). Scenarios
+        can subscribe to ``self.map_sync`` as well.
+        """
+
+        if self.display is not None:
+            self.map_sync.subscribe(self.display.show_map_changes)
+
+        return self.map_sync.start()
+
+    def close(self):
+        self.map_sync.stop()
+        super().close()
+
+    def iter_maps(self, content_type='', content_code='', layer='', hide_blocked_maps=False):
+        params = self._maps_params(content_type, content_code, layer, hide_blocked_maps)
+
+        return self._iter_pages('/maps', params)
+
+    @staticmethod
+    def _maps_params(content_type='', content_code='', layer='', hide_blocked_maps=False):
         params = {}
         if content_type:
             params['content_type'] = content_type
@@ -343,44 +589,112 @@ class GameClient(BaseGameClient):
             params['content_code'] = content_code
         if layer:
             params['layer'] = layer
+        if hide_blocked_maps:
+            params['hide_blocked_maps'] = 'true'
 
-        return self._get_all_pages('/maps', params, default=[])
+        return params
 
-    def _get_all_pages(self, url, params, default=None):
-        """Fetch all pages of a paginated GET endpoint."""
+    def _get_all_pages(self, url, params, default=None, strict=False, quiet=False):
+        """Fetch all pages of a paginated GET endpoint.
+
+        Page 1 is fetched first to learn the page count; the other pages are
+        then fetched concurrently on up to ``pool_size`` workers, each request
+        still paced by the rate limiter, and joined in page order.
+
+        When a later page fails the pages gathered so far are returned, or
+        None when ``strict`` is set, for callers that need all or nothing.
+        ``quiet`` is for background threads: no loading indicator, no
+        re-login prompt and no error message.
+        """
 
         if default is None:
             default = {}
+
+        result, total_pages = self._get_page(url, params, 1, quiet)
+        if result is None:
+            return None if strict else default
+
+        if total_pages > 1:
+            with ThreadPoolExecutor(max_workers=min(self.pool_size, total_pages - 1)) as executor:
+                futures = [
+                    executor.submit(deadline.bind(self._get_page), url, params, page, quiet)
+                    for page in range(2, total_pages + 1)
+                ]
+                for future in futures:
+                    records, _ = future.result()
+                    if records is None:
+                        for pending in futures:
+                            pending.cancel()
+                        if strict:
+                            return None
+                        break
+                    result.extend(records)
+
+        return result
+
+    def _get_page(self, url, params, page, quiet=False):
+        """Fetch one page. Returns (records, total pages), or (None, 0) after printing the API error."""
+
         page_params = dict(params)
         page_params.setdefault('size', 100)
-        page_params['page'] = 1
-        result = []
-        done = False
-
-        while not done:
-            response = self._get_with_reauth(url=url, data=page_params)
-            if response.status_code != 200:
-                if error_block := response.json().get('error'):
-                    self.display.print(error_block.get('message', 'Unknown error.'))
-                return result if result else default
-
-            payload = response.json()
-            data = payload.get('data', [])
-            if isinstance(data, list):
-                result.extend(data)
-            else:
-                result.append(data)
-
-            total_pages = payload.get('pages', 1)
-            if page_params['page'] >= total_pages:
-                done = True
-            else:
-                page_params['page'] += 1
+        page_params['page'] = page
 
-        return result
+        get = self._get if quiet else self._get_with_reauth
+        response = get(url=url, data=page_params)
+        if response.status_code != 200:
+            if not quiet and (error_block := response.error):
+                self.display.print(error_block.get('message', 'Unknown error.'))
+            return None, 0
+
+        data = response.data or []
+        records = list(data) if isinstance(data, list) else [data]
+
+        return records, response.pages or 1
+
+    def _iter_pages(self, url, params):
+        """Lazily yield the records of a paginated GET endpoint.
+
+        The next page is requested only once the consumer has used up the
+        previous one, so breaking out of the loop stops fetching. An API
+        error is printed and ends the iteration.
+        """
+
+        page = 1
+        while True:
+            records, total_pages = self._get_page(url, params, page)
+            if records is None:
+                return
+
+            yield from records
+
+            if page >= total_pages:
+                return
+            page += 1
 
     def get_items(self, name='', min_level=None, max_level=None, type_='',
                   craft_skill='', craft_material=''):
+        params = self._items_params(name, min_level, max_level, type_, craft_skill, craft_material)
+
+        items = self._catalog_records('items', params)
+        if items is not None:
+            return items
+
+        items = self._get_all_pages('/items', params, default=[])
+        self.catalog.add_items(items)
+
+        return items
+
+    def iter_items(self, name='', min_level=None, max_level=None, type_='',
+                   craft_skill='', craft_material=''):
+        params = self._items_params(name, min_level, max_level, type_, craft_skill, craft_material)
+
+        for item in self._iter_pages('/items', params):
+            self.catalog.add_items([item])
+            yield item
+
+    @staticmethod
+    def _items_params(name='', min_level=None, max_level=None, type_='',
+                      craft_skill='', craft_material=''):
         params = {}
         if name:
             params['name'] = name
@@ -395,15 +709,56 @@ class GameClient(BaseGameClient):
         if craft_material:
             params['craft_material'] = craft_material
 
-        return self._get_all_pages('/items', params, default=[])
+        return params
 
     def get_item(self, code=''):
+        item = self.catalog.get('items', code)
+        if item is not None:
+            return item
+
         response = self._get_with_reauth(url=f'/items/{code}')
         if response.status_code == 200:
-            return response.json().get('data', {})
+            item = response.data or {}
+            self.catalog.add_items([item])
+            return item
         return {}
 
+    def get_items_by_codes(self, codes):
+        """Resolve many item codes at once. Returns {code: item}.
+
+        Codes already in the local catalog are answered without a request;
+        the rest are fetched in parallel. Unknown codes are left out.
+        """
+
+        found, missing = self.catalog.get_items({code for code in codes if code})
+
+        if missing:
+            missing = list(missing)
+            with ThreadPoolExecutor(max_workers=min(self.pool_size, len(missing))) as executor:
+                futures = [executor.submit(deadline.bind(self.get_item), code) for code in missing]
+                for code, future in zip(missing, futures):
+                    item = future.result()
+                    if item:
+                        found[code] = item
+
+        return found
+
     def get_monsters(self, name='', min_level=None, max_level=None, drop=''):
+        params = self._monsters_params(name, min_level, max_level, drop)
+
+        records = self._catalog_records('monsters', params)
+        if records is not None:
+            return records
+
+        return self._get_all_pages('/monsters', params, default=[])
+
+    def iter_monsters(self, name='', min_level=None, max_level=None, drop=''):
+        params = self._monsters_params(name, min_level, max_level, drop)
+
+        return self._iter_pages('/monsters', params)
+
+    @staticmethod
+    def _monsters_params(name='', min_level=None, max_level=None, drop=''):
         params = {}
         if name:
             params['name'] = name
@@ -414,15 +769,34 @@ class GameClient(BaseGameClient):
         if drop:
             params['drop'] = drop
 
-        return self._get_all_pages('/monsters', params, default=[])
+        return params
 
     def get_monster(self, code=''):
+        record = self.catalog.get('monsters', code)
+        if record is not None:
+            return record
+
         response = self._get_with_reauth(url=f'/monsters/{code}')
         if response.status_code == 200:
-            return response.json().get('data', {})
+            return response.data or {}
         return {}
 
     def get_resources(self, min_level=None, max_level=None, skill='', drop=''):
+        params = self._resources_params(min_level, max_level, skill, drop)
+
+        records = self._catalog_records('resources', params)
+        if records is not None:
+            return records
+
+        return self._get_all_pages('/resources', params, default=[])
+
+    def iter_resources(self, min_level=None, max_level=None, skill='', drop=''):
+        params = self._resources_params(min_level, max_level, skill, drop)
+
+        return self._iter_pages('/resources', params)
+
+    @staticmethod
+    def _resources_params(min_level=None, max_level=None, skill='', drop=''):
         params = {}
         if min_level is not None:
             params['min_level'] = min_level
@@ -433,32 +807,29 @@ class GameClient(BaseGameClient):
         if drop:
             params['drop'] = drop
 
-        return self._get_all_pages('/resources', params, default=[])
+        return params
 
     def get_resource(self, code=''):
+        record = self.catalog.get('resources', code)
+        if record is not None:
+            return record
+
         response = self._get_with_reauth(url=f'/resources/{code}')
         if response.status_code == 200:
-            return response.json().get('data', {})
+            return response.data or {}
         return {}
 
     def get_maps(self, content_type='', content_code='', layer='',
                  hide_blocked_maps=False, page=1, size=100):
         params = {'page': page, 'size': size}
-        if content_type:
-            params['content_type'] = content_type
-        if content_code:
-            params['content_code'] = content_code
-        if layer:
-            params['layer'] = layer
-        if hide_blocked_maps:
-            params['hide_blocked_maps'] = 'true'
+        params.update(self._maps_params(content_type, content_code, layer, hide_blocked_maps))
 
         return self._get_all_pages('/maps', params, default=[])
 
     def get_map_by_id(self, map_id=0):
         response = self._get_with_reauth(url=f'/maps/id/{map_id}')
         if response.status_code == 200:
-            return response.json().get('data', {})
+            return response.data or {}
         return {}
 
     def get_layer_maps(self, layer='', content_type='', content_code='',
@@ -476,10 +847,25 @@ class GameClient(BaseGameClient):
     def get_map_by_position(self, layer='', x=0, y=0):
         response = self._get_with_reauth(url=f'/maps/{layer}/{x}/{y}')
         if response.status_code == 200:
-            return response.json().get('data', {})
+            return response.data or {}
         return {}
 
     def get_npcs(self, name='', type_='', currency='', item=''):
+        params = self._npcs_params(name, type_, currency, item)
+
+        records = self._catalog_records('npcs', params)
+        if records is not None:
+            return records
+
+        return self._get_all_pages('/npcs/details', params, default=[])
+
+    def iter_npcs(self, name='', type_='', currency='', item=''):
+        params = self._npcs_params(name, type_, currency, item)
+
+        return self._iter_pages('/npcs/details', params)
+
+    @staticmethod
+    def _npcs_params(name='', type_='', currency='', item=''):
         params = {}
         if name:
             params['name'] = name
@@ -490,12 +876,16 @@ class GameClient(BaseGameClient):
         if item:
             params['item'] = item
 
-        return self._get_all_pages('/npcs/details', params, default=[])
+        return params
 
     def get_npc(self, code=''):
+        record = self.catalog.get('npcs', code)
+        if record is not None:
+            return record
+
         response = self._get_with_reauth(url=f'/npcs/details/{code}')
         if response.status_code == 200:
-            return response.json().get('data', {})
+            return response.data or {}
         return {}
 
     def get_npc_items(self, code='', npc='', currency=''):
@@ -519,6 +909,21 @@ class GameClient(BaseGameClient):
         return self._get_all_pages('/npcs/items', params, default=[])
 
     def get_tasks(self, min_level=None, max_level=None, skill='', type_=''):
+        params = self._tasks_params(min_level, max_level, skill, type_)
+
+        records = self._catalog_records('tasks', params)
+        if records is not None:
+            return records
+
+        return self._get_all_pages('/tasks/list', params, default=[])
+
+    def iter_tasks(self, min_level=None, max_level=None, skill='', type_=''):
+        params = self._tasks_params(min_level, max_level, skill, type_)
+
+        return self._iter_pages('/tasks/list', params)
+
+    @staticmethod
+    def _tasks_params(min_level=None, max_level=None, skill='', type_=''):
         params = {}
         if min_level is not None:
             params['min_level'] = min_level
@@ -529,12 +934,16 @@ class GameClient(BaseGameClient):
         if type_:
             params['type'] = type_
 
-        return self._get_all_pages('/tasks/list', params, default=[])
+        return params
 
     def get_task(self, code=''):
+        record = self.catalog.get('tasks', code)
+        if record is not None:
+            return record
+
         response = self._get_with_reauth(url=f'/tasks/list/{code}')
         if response.status_code == 200:
-            return response.json().get('data', {})
+            return response.data or {}
         return {}
 
     def get_task_rewards(self):
@@ -543,7 +952,7 @@ class GameClient(BaseGameClient):
     def get_task_reward(self, code=''):
         response = self._get_with_reauth(url=f'/tasks/rewards/{code}')
         if response.status_code == 200:
-            return response.json().get('data', {})
+            return response.data or {}
         return {}
 
     def get_achievements(self, type_=''):
@@ -556,7 +965,7 @@ class GameClient(BaseGameClient):
     def get_achievement(self, code=''):
         response = self._get_with_reauth(url=f'/achievements/{code}')
         if response.status_code == 200:
-            return response.json().get('data', {})
+            return response.data or {}
         return {}
 
     def get_account_achievements(self, account='', type_='', completed=None):
@@ -574,16 +983,24 @@ class GameClient(BaseGameClient):
     def get_badge(self, code=''):
         response = self._get_with_reauth(url=f'/badges/{code}')
         if response.status_code == 200:
-            return response.json().get('data', {})
+            return response.data or {}
         return {}
 
     def get_effects(self):
+        effects = self.catalog.records('effects')
+        if effects is not None:
+            return effects
+
         return self._get_all_pages('/effects', {}, default=[])
 
     def get_effect(self, code=''):
+        record = self.catalog.get('effects', code)
+        if record is not None:
+            return record
+
         response = self._get_with_reauth(url=f'/effects/{code}')
         if response.status_code == 200:
-            return response.json().get('data', {})
+            return response.data or {}
         return {}
 
     def get_events(self, type_=''):
@@ -594,7 +1011,16 @@ class GameClient(BaseGameClient):
         return self._get_all_pages('/events', params, default=[])
 
     def get_active_events(self):
-        return self._get_all_pages('/events/active', {}, default=[])
+        return self._get_active_events()
+
+    def _get_active_events(self, quiet=False):
+        events = self._get_all_pages('/events/active', {}, default=False, quiet=quiet)
+        if events is False:
+            return []
+
+        self._restore_map_cells(self.map_cache.apply_events(events), quiet)
+
+        return events
 
     def get_ge_history_by_code(self, code='', account=''):
         params = {}
@@ -604,6 +1030,17 @@ class GameClient(BaseGameClient):
         return self._get_all_pages(f'/grandexchange/history/{code}', params, default=[])
 
     def get_ge_orders(self, code='', account='', order_type=''):
+        params = self._ge_orders_params(code, account, order_type)
+
+        return self._get_all_pages('/grandexchange/orders', params, default=[])
+
+    def iter_ge_orders(self, code='', account='', order_type=''):
+        params = self._ge_orders_params(code, account, order_type)
+
+        return self._iter_pages('/grandexchange/orders', params)
+
+    @staticmethod
+    def _ge_orders_params(code='', account='', order_type=''):
         params = {}
         if code:
             params['code'] = code
@@ -612,12 +1049,12 @@ class GameClient(BaseGameClient):
         if order_type:
             params['type'] = order_type
 
-        return self._get_all_pages('/grandexchange/orders', params, default=[])
+        return params
 
     def get_ge_order(self, order_id=''):
         response = self._get_with_reauth(url=f'/grandexchange/orders/{order_id}')
         if response.status_code == 200:
-            return response.json().get('data', {})
+            return response.data or {}
         return {}
 
     def get_my_ge_orders(self, code='', order_type=''):
@@ -647,36 +1084,62 @@ class GameClient(BaseGameClient):
     def get_character_logs(self, name=''):
         return self._get_all_pages(f'/my/logs/{name}', {'size': 50}, default=[])
 
+    def iter_logs(self, name=''):
+        """Newest-first action logs of the account, or of one character when name is given."""
+
+        url = f'/my/logs/{name}' if name else '/my/logs'
+
+        return self._iter_pages(url, {'size': 50})
+
     def get_my_bank(self):
         response = self._get_with_reauth(url='/my/bank')
         if response.status_code == 200:
-            return response.json().get('data', {})
+            return response.data or {}
         return {}
 
     def get_my_bank_items(self, item_code=''):
+        params = self._bank_items_params(item_code)
+
+        return self._get_all_pages('/my/bank/items', params, default=[])
+
+    def iter_my_bank_items(self, item_code=''):
+        params = self._bank_items_params(item_code)
+
+        return self._iter_pages('/my/bank/items', params)
+
+    @staticmethod
+    def _bank_items_params(item_code=''):
         params = {}
         if item_code:
             params['item_code'] = item_code
 
-        return self._get_all_pages('/my/bank/items', params, default=[])
+        return params
 
     def get_leaderboard_accounts(self, sort='', name='', page=1, size=20):
-        params = {'page': page, 'size': size}
-        if sort:
-            params['sort'] = sort
-        if name:
-            params['name'] = name
+        """One page of the account leaderboard."""
 
-        return self._get_all_pages('/leaderboard/accounts', params, default=[])
+        return self._get_leaderboard_page(LeaderboardCursor.ACCOUNTS, sort, name, page, size)
 
     def get_leaderboard_characters(self, sort='', name='', page=1, size=20):
-        params = {'page': page, 'size': size}
+        """One page of the character leaderboard."""
+
+        return self._get_leaderboard_page(LeaderboardCursor.CHARACTERS, sort, name, page, size)
+
+    def _get_leaderboard_page(self, kind, sort, name, page, size):
+        params = {'size': size}
         if sort:
             params['sort'] = sort
         if name:
             params['name'] = name
 
-        return self._get_all_pages('/leaderboard/characters', params, default=[])
+        records, _ = self._get_page(f'/leaderboard/{kind}', params, page)
+
+        return records or []
+
+    def leaderboard(self, kind=LeaderboardCursor.CHARACTERS, sort='', size=20):
+        """Cursor over a leaderboard that downloads one page at a time."""
+
+        return LeaderboardCursor(self, kind=kind, sort=sort, size=size)
 
     def get_active_characters(self):
         return self._get_all_pages('/characters/active', {}, default=[])
@@ -684,11 +1147,11 @@ class GameClient(BaseGameClient):
     def get_account_characters(self, account=''):
         response = self._get_with_reauth(url=f'/accounts/{account}/characters')
         if response.status_code == 200:
-            return response.json().get('data', [])
+            return response.data or []
         return []
 
     def get_account_info(self, account=''):
         response = self._get_with_reauth(url=f'/accounts/{account}')
         if response.status_code == 200:
-            return response.json().get('data', {})
+            return response.data or {}
         return {}
@@ -0,0 +1,81 @@
+"""JSON codec used for API request and response bodies.
+
+Picks the fastest available backend: orjson, then msgspec, then the
+standard library. orjson and msgspec are soft dependencies; the client
+works the same without them, just slower on large catalog pages.
+Whatever the backend, ``loads`` raises ``json.JSONDecodeError`` on bad
+input and ``dumps`` returns UTF-8 bytes.
+``parse_time`` turns the API's ISO timestamps into aware datetimes and
+``parse_http_date`` does the same for the HTTP ``Date`` header.
+"""
+
+import json
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+if orjson is not None:
+    NAME = 'orjson'
+
+    def loads(data):
+        return orjson.loads(data)
+
+    def dumps(obj):
+        return orjson.dumps(obj)
+
+elif msgspec is not None:
+    NAME = 'msgspec'
+    _decoder = msgspec.json.Decoder()
+    _encoder = msgspec.json.Encoder()
+
+    def loads(data):
+        try:
+            return _decoder.decode(data)
+        except msgspec.DecodeError as error:
+            raise json.JSONDecodeError(str(error), '', 0) from error
+
+    def dumps(obj):
+        return _encoder.encode(obj)
+
+else:
+    NAME = 'json'
+
+    def loads(data):
+        return json.loads(data)
+
+    def dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def parse_time(value):
+    """Aware datetime from an API timestamp such as '2025-01-01T12:00:00.000Z', or None."""
+
+    if not value:
+        return None
+
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_http_date(value):
+    """Aware datetime from an HTTP ``Date`` header, or None."""
+
+    if not value:
+        return None
+
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,71 @@
+"""Deadlines for high-level operations.
+
+A block of code run under ``deadline(seconds)`` gives every HTTP call made
+inside it, retries included, only the time that is left: per-request
+timeouts are cut down to the remaining budget and a call started after the
+budget ran out raises ``DeadlineExceeded`` instead of reaching the network.
+Nested deadlines can only shorten the outer one.
+
+The deadline lives in a context variable, so it follows asyncio tasks on its
+own; code that hands work to worker threads wraps the callable with
+``bind()`` so the workers see the caller's deadline.
+"""
+
+import contextvars
+import functools
+from contextlib import contextmanager
+from time import monotonic
+
+_expires_at = contextvars.ContextVar('deadline_expires_at', default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """The time budget of the enclosing ``deadline()`` block ran out."""
+
+
+@contextmanager
+def deadline(seconds):
+    """Limit the block to ``seconds``; None adds no limit of its own."""
+
+    if seconds is None:
+        yield
+        return
+
+    expires_at = monotonic() + seconds
+    outer = _expires_at.get()
+    if outer is not None:
+        expires_at = min(expires_at, outer)
+
+    token = _expires_at.set(expires_at)
+    try:
+        yield
+    finally:
+        _expires_at.reset(token)
+
+
+def remaining():
+    """Seconds left in the current deadline, or None when there is none."""
+
+    expires_at = _expires_at.get()
+    if expires_at is None:
+        return None
+
+    return expires_at - monotonic()
+
+
+def check():
+    """Raise DeadlineExceeded if the current deadline has passed."""
+
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded('deadline exceeded')
+
+
+def bind(func):
+    """Wrap func to run in a copy of the caller's context, deadline included.
+
+    Call once per submitted task: a copied context can only be entered by
+    one thread at a time.
+    """
+
+    return functools.partial(contextvars.copy_context().run, func)
@@ -1,6 +1,8 @@
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 
+from base.catalog import map_content
 from base.enums import (
     CraftSkillEnum,
     EquipmentSlotsEnum,
@@ -79,7 +81,7 @@ class Display(ABC):
 
     @staticmethod
     def _menu_label(item):
-        if isinstance(item, dict):
+        if isinstance(item, Mapping):
             return item.get('name', item.get('code', str(item)))
         return str(item).replace('_', ' ').capitalize()
 
@@ -119,10 +121,8 @@ class Display(ABC):
 
     def show_inventory(self, character, item_names):
         inventory = getattr(character, 'inventory', None) or []
-        total = sum(s.get('quantity', 0) for s in inventory if s.get('code'))
-        slots = sum(1 for s in inventory if s.get('code'))
-        max_items = getattr(character, 'inventory_max_items', 0)
-        lines = [f'Fill: {total}/{max_items} (slots: {slots})']
+        index = character.inventory_index
+        lines = [f'Fill: {index.total}/{index.max_items} (slots: {index.used_slots})']
         for slot in inventory:
             code = slot.get('code')
             if not code:
@@ -211,6 +211,41 @@ class Display(ABC):
     def hide_loading(self):
         pass
 
+    def show_catalog_progress(self, name, done, total):
+        pass
+
+    def show_map_changes(self, changes):
+        pass
+
+    def show_character_changes(self, character, changes):
+        pass
+
+    @staticmethod
+    def _format_character_changes(character, changes):
+        """Level-up lines for the character and skill levels in changes."""
+
+        lines = []
+        for field in sorted(changes.old):
+            if field == 'level' or field.endswith('_level'):
+                name = 'Character' if field == 'level' else field[:-len('_level')].title()
+                lines.append(f'{name} level {changes.old[field]} -> {getattr(character, field)}')
+        return lines
+
+    @staticmethod
+    def _format_map_changes(changes):
+        lines = []
+        for change in changes:
+            old = map_content(change.old or {})
+            new = map_content(change.new or {})
+            if old.get('code') == new.get('code'):
+                continue
+            cell = change.new or change.old
+            lines.append(
+                f'Map {cell.get("name", "?")} ({cell.get("x", "?")}, {cell.get("y", "?")}) [{cell.get("layer", "?")}]: '
+                f'{old.get("code") or "nothing"} -> {new.get("code") or "nothing"}'
+            )
+        return lines
+
     # ── Stats formatting helpers ──────────────────────────────────
 
     def _format_stats_core(self, character):
@@ -0,0 +1,88 @@
+class InventoryIndex:
+    """Per-code quantities and slot counts of a character's inventory.
+
+    The API sends the whole inventory, one entry per slot, with every
+    character block. ``update`` compares it slot by slot with the previous
+    one and adjusts the counts for the slots that changed, so the questions
+    the scenarios and displays ask on every loop (how many of an item, how
+    full is the bag) are answered without scanning the list.
+    """
+
+    __slots__ = ('_slots', '_quantities', 'used_slots', 'total', 'max_items')
+
+    def __init__(self, slots=(), max_items=0):
+        self._slots = []
+        self._quantities = {}
+        self.used_slots = 0
+        self.total = 0
+        self.max_items = 0
+        self.update(slots, max_items)
+
+    def _remove(self, code, quantity):
+        left = self._quantities[code] - quantity
+        if left > 0:
+            self._quantities[code] = left
+        else:
+            del self._quantities[code]
+        self.used_slots -= 1
+        self.total -= quantity
+
+    def _add(self, code, quantity):
+        self._quantities[code] = self._quantities.get(code, 0) + quantity
+        self.used_slots += 1
+        self.total += quantity
+
+    def update(self, slots, max_items=None):
+        """Take the inventory list of a character block (and inventory_max_items, if sent)."""
+
+        if max_items is not None:
+            self.max_items = max_items
+
+        previous = self._slots
+        current = [(slot.get('code') or None, slot.get('quantity', 0)) for slot in slots or ()]
+        for index in range(max(len(previous), len(current))):
+            old = previous[index] if index < len(previous) else (None, 0)
+            new = current[index] if index < len(current) else (None, 0)
+            if old == new:
+                continue
+            if old[0] is not None:
+                self._remove(*old)
+            if new[0] is not None:
+                self._add(*new)
+
+        self._slots = current
+
+    def quantity(self, code):
+        return self._quantities.get(code, 0)
+
+    def __contains__(self, code):
+        return code in self._quantities
+
+    def __len__(self):
+        return len(self._quantities)
+
+    def codes(self):
+        return self._quantities.keys()
+
+    def items(self):
+        """(code, quantity) pairs, one per distinct item."""
+
+        return self._quantities.items()
+
+    @property
+    def slots(self):
+        return len(self._slots)
+
+    @property
+    def free_slots(self):
+        return len(self._slots) - self.used_slots
+
+    @property
+    def free_space(self):
+        """Items that still fit under inventory_max_items."""
+
+        return max(0, self.max_items - self.total)
+
+    @property
+    def fill_ratio(self):
+        return self.total / self.max_items if self.max_items else 0
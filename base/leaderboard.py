@@ -0,0 +1,96 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from base import deadline
+
+
+class LeaderboardCursor:
+    """Page-at-a-time view of an account or character leaderboard.
+
+    Only the page being looked at is downloaded. As soon as a page is shown
+    the next one is requested in the background, so stepping forward is
+    usually answered without waiting. ``find(name)`` jumps straight to the
+    page holding a player's rank by asking the API for that player alone.
+    """
+
+    ACCOUNTS = 'accounts'
+    CHARACTERS = 'characters'
+
+    def __init__(self, client, kind=CHARACTERS, sort='', size=20, page=1):
+        self.client = client
+        self.url = f'/leaderboard/{kind}'
+        self.params = {'size': size}
+        if sort:
+            self.params['sort'] = sort
+
+        self.size = size
+        self.page = page
+        self.pages = None
+        self._pages = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='artifacts-leaderboard')
+
+    def _fetch(self, page):
+        records, pages = self.client._get_page(self.url, self.params, page)
+        if records is None:
+            return [], self.pages or page
+
+        return records, pages
+
+    def _request(self, page):
+        """Future for page, reusing a prefetch already in flight."""
+
+        future = self._pages.get(page)
+        if future is None:
+            future = self._pages[page] = self._executor.submit(deadline.bind(self._fetch), page)
+
+        return future
+
+    def current(self):
+        """Entries of the current page; starts prefetching the next one."""
+
+        records, self.pages = self._request(self.page).result()
+
+        for page in list(self._pages):
+            if page not in (self.page, self.page + 1):
+                del self._pages[page]
+
+        if self.page < self.pages:
+            self._request(self.page + 1)
+
+        return records
+
+    def seek(self, page):
+        self.page = max(1, page)
+
+        return self.current()
+
+    def next_page(self):
+        """Step forward. Returns [] past the last page."""
+
+        if self.pages is not None and self.page >= self.pages:
+            return []
+
+        return self.seek(self.page + 1)
+
+    def previous_page(self):
+        return self.seek(self.page - 1)
+
+    def find(self, name):
+        """Move to the page holding name's rank. Returns its entry, or None if not ranked."""
+
+        records, _ = self.client._get_page(self.url, {**self.params, 'name': name}, 1)
+        entry = next((record for record in records or [] if record.get('name') == name), None)
+        if entry is None or not entry.get('position'):
+            return None
+
+        self.seek((entry['position'] - 1) // self.size + 1)
+
+        return entry
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,98 @@
+import threading
+from datetime import datetime, timezone
+from time import monotonic
+
+from base.catalog import filter_maps
+from base.codec import parse_time
+
+
+class MapCache:
+    """Map cells served from memory, kept in step with game events.
+
+    The catalog holds the regular map cells, which only change with the game
+    version. Events swap the content of a few cells for a limited time; their
+    cells are kept here, keyed by map id, with the event's end time, and laid
+    over the catalog's cells on every read. An event that is past its end
+    time, or that ``/events/active`` no longer reports, hands back its cell
+    so the caller can restore just that one.
+    """
+
+    # Seconds an /events/active answer is trusted before map reads ask again.
+    EVENTS_MAX_AGE = 60
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.checked_at = None
+        self._events = {}
+        self._lock = threading.Lock()
+
+    def events_stale(self):
+        return self.checked_at is None or monotonic() - self.checked_at > self.EVENTS_MAX_AGE
+
+    def apply_events(self, events):
+        """Take an /events/active answer.
+
+        Returns {map id: cell to restore} for the events that are gone. The
+        cell is the event's ``previous_map`` when the API sent one, else None
+        and the caller has to fetch it.
+        """
+
+        active = {}
+        for event in events:
+            cell = event.get('map') or {}
+            if cell.get('map_id') is not None:
+                active[cell['map_id']] = (cell, parse_time(event.get('expiration')), event.get('previous_map'))
+
+        with self._lock:
+            ended = {map_id: entry[2] for map_id, entry in self._events.items() if map_id not in active}
+            self._events = active
+            self.checked_at = monotonic()
+
+        return ended
+
+    def expire(self):
+        """Drop the events past their end time. Returns {map id: cell to restore} like apply_events."""
+
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            ended = {
+                map_id: entry[2] for map_id, entry in self._events.items()
+                if entry[1] is not None and entry[1] <= now
+            }
+            for map_id in ended:
+                del self._events[map_id]
+
+        return ended
+
+    def event_cells(self):
+        with self._lock:
+            return {map_id: entry[0] for map_id, entry in self._events.items()}
+
+    def cells(self):
+        """Every map cell, event cells in place, or None while maps are not loaded in full."""
+
+        maps = self.catalog.records('maps')
+        if maps is None:
+            return None
+
+        events = self.event_cells()
+        if not events:
+            return maps
+
+        return [events.get(cell.get('map_id'), cell) for cell in maps]
+
+    def find(self, content_type='', content_code='', layer=''):
+        cells = self.cells()
+        if cells is None:
+            return None
+
+        return filter_maps(cells, content_type, content_code, layer)
+
+    def at(self, layer, x, y):
+        """The cell at a position, event content included, or None if it is not known."""
+
+        cell = self.catalog.map_at(layer, x, y)
+        if cell is None:
+            return None
+
+        return self.event_cells().get(cell.get('map_id'), cell)
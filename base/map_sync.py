@@ -0,0 +1,114 @@
+import threading
+from collections import namedtuple
+
+import requests
+
+
+MapChange = namedtuple('MapChange', ['kind', 'map_id', 'old', 'new'])
+
+
+class MapSyncService:
+    """Background poller that publishes map changes to subscribers.
+
+    Every ``interval`` seconds it brings the client's map cache up to date
+    (one /events/active request, plus one request per cell whose event has
+    ended) and diffs the resulting cells against the copy from the previous
+    poll. Subscribers are called on the polling thread with the list of
+    ``MapChange`` tuples of that poll, and only when something changed, so
+    displays and scenarios no longer need to re-read the map to notice.
+    """
+
+    ADDED = 'added'
+    REMOVED = 'removed'
+    CHANGED = 'changed'
+
+    # Seconds stop() waits for a poll in progress; the thread is a daemon.
+    STOP_TIMEOUT = 5
+
+    def __init__(self, client, interval=60):
+        self.client = client
+        self.interval = interval
+        self._cells = None
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def subscribe(self, callback):
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    @staticmethod
+    def diff(old_cells, new_cells):
+        """MapChange list between two {map id: cell} dicts."""
+
+        changes = []
+        for map_id, cell in new_cells.items():
+            old = old_cells.get(map_id)
+            if old is None:
+                changes.append(MapChange(MapSyncService.ADDED, map_id, None, cell))
+            elif old is not cell and old != cell:
+                changes.append(MapChange(MapSyncService.CHANGED, map_id, old, cell))
+
+        for map_id, cell in old_cells.items():
+            if map_id not in new_cells:
+                changes.append(MapChange(MapSyncService.REMOVED, map_id, cell, None))
+
+        return changes
+
+    def poll(self):
+        """Sync once and publish. Returns the changes, [] on the first poll or while maps are not loaded in full."""
+
+        if not self.client._sync_map_events(force=True, quiet=True):
+            return []
+
+        cells = {cell.get('map_id'): cell for cell in self.client.map_cache.cells() or []}
+        previous, self._cells = self._cells, cells
+        if previous is None:
+            return []
+
+        changes = self.diff(previous, cells)
+        if changes:
+            with self._lock:
+                subscribers = list(self._subscribers)
+            for callback in subscribers:
+                callback(changes)
+
+        return changes
+
+    def _run(self):
+        while True:
+            try:
+                self.poll()
+            except (requests.exceptions.RequestException, ValueError):
+                pass
+            except Exception as error:
+                display = getattr(self.client, 'display', None)
+                if display is not None:
+                    display.print(f'Map sync failed: {type(error).__name__}: {error}')
+            if self._stopped.wait(self.interval):
+                return
+
+    def start(self):
+        """Start polling in a daemon thread, which is returned. Does nothing when interval is 0."""
+
+        if self._thread is not None or not self.interval:
+            return self._thread
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name='artifacts-map-sync', daemon=True)
+        self._thread.start()
+
+        return self._thread
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(self.STOP_TIMEOUT)
+            self._thread = None
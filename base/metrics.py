@@ -0,0 +1,152 @@
+import json
+import re
+import threading
+
+
+class EndpointStats:
+    """Counters for one ``METHOD /endpoint/template`` pair."""
+
+    __slots__ = ('calls', 'retries', 'errors', 'bytes', 'latency_total', 'latency_max',
+                 'throttled', 'buckets', 'statuses', 'idle_count', 'idle_total', 'idle_max')
+
+    def __init__(self, bucket_count):
+        self.calls = 0
+        self.retries = 0
+        self.errors = 0
+        self.bytes = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.throttled = 0.0
+        self.buckets = [0] * bucket_count
+        self.statuses = {}
+        self.idle_count = 0
+        self.idle_total = 0.0
+        self.idle_max = 0.0
+
+
+class Metrics:
+    """Per-endpoint transport metrics shared by an account client and its characters.
+
+    Every logical request that reaches the network is recorded under its
+    endpoint template (``/my/{name}/action/fight`` rather than the concrete
+    URL): call count, latency histogram, response bytes, retries, time spent
+    waiting on the rate limiter and a breakdown by status code, or by
+    exception name for calls that failed without a response. Latency is what
+    the caller waited, retries and rate limiter waits included. Cache hits
+    never reach the transport and are not counted here; see
+    ``ResponseCache.stats``.
+
+    Character actions also report their idle gap: the time between the end
+    of the previous action's cooldown and the request for the next one, 0
+    when the action was waiting for the cooldown to end.
+    """
+
+    # Upper bounds in seconds; the last bucket collects everything slower.
+    LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    TEMPLATES = (
+        (re.compile(r'^/my/[^/]+/action/(.+)$'), r'/my/{name}/action/\1'),
+        (re.compile(r'^/my/logs/[^/]+$'), '/my/logs/{name}'),
+        (re.compile(r'^/characters/(?!create$|delete$)[^/]+$'), '/characters/{name}'),
+        (re.compile(r'^/accounts/[^/]+(/.*)?$'), r'/accounts/{account}\1'),
+        (re.compile(r'^/maps/id/[^/]+$'), '/maps/id/{map_id}'),
+        (re.compile(r'^/maps/[^/]+/[^/]+/[^/]+$'), '/maps/{layer}/{x}/{y}'),
+        (re.compile(r'^/maps/(?!id$)[^/]+$'), '/maps/{layer}'),
+        (re.compile(r'^/grandexchange/orders/[^/]+$'), '/grandexchange/orders/{order_id}'),
+        (re.compile(r'^/(items|monsters|resources|achievements|badges|effects)/[^/]+$'), r'/\1/{code}'),
+        (re.compile(r'^/(npcs/details|npcs/items|tasks/list|tasks/rewards|grandexchange/history)/[^/]+$'),
+         r'/\1/{code}'),
+    )
+
+    def __init__(self):
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def template(cls, url):
+        """Collapse the variable parts of an API path into placeholders."""
+
+        for pattern, replacement in cls.TEMPLATES:
+            if pattern.match(url):
+                return pattern.sub(replacement, url)
+
+        return url
+
+    def _stats(self, method, url):
+        key = f'{method.upper()} {self.template(url)}'
+        stats = self._endpoints.get(key)
+        if stats is None:
+            stats = self._endpoints[key] = EndpointStats(len(self.LATENCY_BUCKETS) + 1)
+
+        return stats
+
+    def record(self, method, url, latency, status, size=0, retries=0, throttled=0.0, error=False):
+        """Record one finished call. ``status`` is the HTTP code or an exception name."""
+
+        bucket = len(self.LATENCY_BUCKETS)
+        for index, bound in enumerate(self.LATENCY_BUCKETS):
+            if latency <= bound:
+                bucket = index
+                break
+
+        with self._lock:
+            stats = self._stats(method, url)
+            stats.calls += 1
+            stats.retries += retries
+            stats.errors += int(error)
+            stats.bytes += size
+            stats.latency_total += latency
+            stats.latency_max = max(stats.latency_max, latency)
+            stats.throttled += throttled
+            stats.buckets[bucket] += 1
+            status = str(status)
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+
+    def record_idle(self, method, url, gap):
+        """Record the idle gap before one character action."""
+
+        gap = max(0.0, gap)
+        with self._lock:
+            stats = self._stats(method, url)
+            stats.idle_count += 1
+            stats.idle_total += gap
+            stats.idle_max = max(stats.idle_max, gap)
+
+    def snapshot(self):
+        """Plain-dict copy of all counters, keyed by ``METHOD /template``."""
+
+        labels = [f'<={bound}' for bound in self.LATENCY_BUCKETS] + [f'>{self.LATENCY_BUCKETS[-1]}']
+
+        with self._lock:
+            return {
+                key: self._snapshot_stats(stats, labels)
+                for key, stats in sorted(self._endpoints.items())
+            }
+
+    @staticmethod
+    def _snapshot_stats(stats, labels):
+        result = {
+            'calls': stats.calls,
+            'retries': stats.retries,
+            'errors': stats.errors,
+            'bytes': stats.bytes,
+            'latency_mean': stats.latency_total / stats.calls if stats.calls else 0.0,
+            'latency_max': stats.latency_max,
+            'latency_histogram': dict(zip(labels, stats.buckets)),
+            'throttled': stats.throttled,
+            'statuses': dict(stats.statuses),
+        }
+        if stats.idle_count:
+            result['idle_mean'] = stats.idle_total / stats.idle_count
+            result['idle_max'] = stats.idle_max
+            result['idle_total'] = stats.idle_total
+
+        return result
+
+    def dump_json(self, path):
+        with open(path, 'w') as fh:
+            json.dump(self.snapshot(), fh, indent=2)
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
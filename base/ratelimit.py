@@ -0,0 +1,148 @@
+import threading
+from email.utils import parsedate_to_datetime
+from time import monotonic, sleep, time
+
+from base import deadline
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at ``rate`` tokens per second."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated = monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self.updated
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Block until a token is available, then take it.
+
+        Raises DeadlineExceeded at once, without sleeping, if the wait would
+        outlast the current ``deadline()``.
+        """
+
+        while True:
+            with self._lock:
+                now = monotonic()
+                self._refill(now)
+
+                if now < self.blocked_until:
+                    wait = self.blocked_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                else:
+                    wait = (1 - self.tokens) / self.rate
+
+            left = deadline.remaining()
+            if left is not None and wait > left:
+                raise deadline.DeadlineExceeded('rate limit wait outlasts the deadline')
+
+            sleep(wait)
+
+    def block_for(self, seconds):
+        """Refuse tokens for the next ``seconds`` seconds and drain the bucket."""
+
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, monotonic() + seconds)
+            self.tokens = 0
+
+    def sync_remaining(self, remaining):
+        """Never hand out more tokens than the server says are left."""
+
+        with self._lock:
+            self._refill(monotonic())
+            self.tokens = min(self.tokens, remaining)
+
+
+class RateLimiter:
+    """Per-category request pacing for one account.
+
+    The API limits token, data and action calls separately, so each category
+    gets its own bucket. Buckets start from conservative defaults and are
+    corrected from the ``X-RateLimit-*`` response headers; a 429 response
+    blocks its bucket for the ``Retry-After`` delay.
+    """
+
+    TOKEN = 'token'
+    DATA = 'data'
+    ACTION = 'action'
+
+    DEFAULT_LIMITS = {
+        TOKEN: 3,
+        DATA: 16,
+        ACTION: 5,
+    }
+
+    TOO_MANY_REQUESTS = 429
+    DEFAULT_RETRY_AFTER = 1
+
+    def __init__(self, limits=None):
+        limits = {**self.DEFAULT_LIMITS, **(limits or {})}
+        self.buckets = {category: TokenBucket(rate) for category, rate in limits.items()}
+
+    @classmethod
+    def category_for(cls, method, url):
+        """Map a request onto the rate-limit category the server counts it in."""
+
+        if url == '/token':
+            return cls.TOKEN
+
+        if method != 'get' and '/action/' in url:
+            return cls.ACTION
+
+        return cls.DATA
+
+    def acquire(self, category):
+        self.buckets[category].acquire()
+
+    def observe(self, category, response):
+        """Update the category's bucket from the response status and headers."""
+
+        bucket = self.buckets[category]
+        headers = response.headers
+
+        if response.status_code == self.TOO_MANY_REQUESTS:
+            bucket.block_for(self._parse_retry_after(headers.get('Retry-After')))
+            return
+
+        remaining = self._parse_number(headers.get('X-RateLimit-Remaining'))
+        if remaining is None:
+            return
+
+        bucket.sync_remaining(remaining)
+
+        if remaining < 1:
+            reset = self._parse_number(headers.get('X-RateLimit-Reset'))
+            if reset is not None:
+                # The reset header is either a delay in seconds or an epoch timestamp.
+                delay = reset - time() if reset > 1e9 else reset
+                bucket.block_for(max(0.0, delay))
+
+    @staticmethod
+    def _parse_number(value):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    @classmethod
+    def _parse_retry_after(cls, value):
+        if value is None:
+            return cls.DEFAULT_RETRY_AFTER
+
+        seconds = cls._parse_number(value)
+        if seconds is not None:
+            return max(0.0, seconds)
+
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time())
+        except (TypeError, ValueError):
+            return cls.DEFAULT_RETRY_AFTER
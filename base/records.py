@@ -0,0 +1,125 @@
+"""Compact read-only records for catalog data.
+
+A full catalog holds thousands of items and map cells. Kept as the decoded
+JSON dicts, every record carries its own hash table and its own copy of each
+code string. The record types here keep the known fields in ``__slots__``,
+intern codes and other repeated strings, and keep anything the API adds
+later in a small ``_extra`` dict so no data is lost.
+
+Records are read-only ``Mapping`` objects, so existing code written against
+the API dicts (``item['code']``, ``item.get('craft')``, ``dict(item)``,
+``'craft' in item``) keeps working unchanged.
+"""
+
+import sys
+from collections.abc import Mapping
+
+_MISSING = object()
+
+
+class Record(Mapping):
+    """Slotted stand-in for one API record dict."""
+
+    __slots__ = ('_extra',)
+
+    FIELDS = ()
+    INTERNED = ('code', 'type', 'subtype', 'skill', 'layer', 'skin')
+    _FIELD_SET = frozenset()
+    _INTERNED_FIELDS = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+        cls._INTERNED_FIELDS = tuple(field for field in cls.FIELDS if field in cls.INTERNED)
+
+    @classmethod
+    def from_api(cls, payload):
+        if isinstance(payload, cls):
+            return payload
+
+        record = cls.__new__(cls)
+        set_field = object.__setattr__
+        get = payload.get
+        for field in cls.FIELDS:
+            set_field(record, field, get(field, _MISSING))
+        for field in cls._INTERNED_FIELDS:
+            value = get(field)
+            if isinstance(value, str):
+                set_field(record, field, sys.intern(value))
+
+        extra = None
+        if not payload.keys() <= cls._FIELD_SET:
+            extra = {key: value for key, value in payload.items() if key not in cls._FIELD_SET}
+        set_field(record, '_extra', extra)
+
+        return record
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} is read-only')
+
+    def __getitem__(self, key):
+        if key in self._FIELD_SET:
+            value = getattr(self, key)
+            if value is not _MISSING:
+                return value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in self._FIELD_SET:
+            value = getattr(self, key)
+            return default if value is _MISSING else value
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def __iter__(self):
+        for field in self.FIELDS:
+            if getattr(self, field) is not _MISSING:
+                yield field
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({dict(self)!r})'
+
+    def to_api(self):
+        return dict(self)
+
+
+class ItemRecord(Record):
+    __slots__ = FIELDS = (
+        'name', 'code', 'level', 'type', 'subtype', 'description', 'conditions',
+        'effects', 'craft', 'tradeable',
+    )
+
+
+class MonsterRecord(Record):
+    __slots__ = FIELDS = (
+        'name', 'code', 'level', 'type', 'hp', 'attack_fire', 'attack_earth',
+        'attack_water', 'attack_air', 'res_fire', 'res_earth', 'res_water',
+        'res_air', 'critical_strike', 'initiative', 'effects', 'min_gold',
+        'max_gold', 'drops',
+    )
+
+
+class ResourceRecord(Record):
+    __slots__ = FIELDS = ('name', 'code', 'skill', 'level', 'drops')
+
+
+class MapCell(Record):
+    __slots__ = FIELDS = ('map_id', 'name', 'skin', 'x', 'y', 'layer', 'access', 'interactions')
+
+
+# Catalog collection -> record type.
+RECORD_TYPES = {
+    'items': ItemRecord,
+    'monsters': MonsterRecord,
+    'resources': ResourceRecord,
+    'maps': MapCell,
+}
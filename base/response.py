@@ -0,0 +1,61 @@
+from base import codec
+
+
+class ApiResponse:
+    """API response whose JSON body is decoded exactly once.
+
+    Wraps a ``requests.Response`` and keeps the body, parsed with the fastest
+    available codec, in ``payload``; the envelope fields the API uses
+    (``data``, ``error`` and the pagination block) are read from it without
+    re-decoding. ``json()`` is kept for compatibility and returns the cached
+    payload.
+    """
+
+    BODYLESS_STATUSES = (204, 304)
+
+    def __init__(self, response):
+        self.raw = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.content = response.content
+
+        if self.status_code in self.BODYLESS_STATUSES:
+            self.payload = {}
+        else:
+            self.payload = codec.loads(self.content)
+
+    def json(self):
+        return self.payload
+
+    def _field(self, name):
+        if isinstance(self.payload, dict):
+            return self.payload.get(name)
+        return None
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def data(self):
+        return self._field('data')
+
+    @property
+    def error(self):
+        return self._field('error')
+
+    @property
+    def total(self):
+        return self._field('total')
+
+    @property
+    def page(self):
+        return self._field('page')
+
+    @property
+    def size(self):
+        return self._field('size')
+
+    @property
+    def pages(self):
+        return self._field('pages')
@@ -0,0 +1,60 @@
+import threading
+
+from base import deadline
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Collapse concurrent identical calls into one.
+
+    While a call for a key is in flight, other threads asking for the same
+    key wait for it and receive its result (or its exception) instead of
+    running the call again. ``deduplicated`` counts those shared results.
+
+    Waiting is bound by the waiter's own ``deadline()``. A leader that ran
+    out of its deadline says nothing about the waiters' budgets, so they
+    run the call again themselves instead of taking its DeadlineExceeded.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.deduplicated = 0
+
+    def do(self, key, func):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.deduplicated += 1
+
+        if not leader:
+            if not call.done.wait(deadline.remaining()):
+                raise deadline.DeadlineExceeded('deadline exceeded')
+            if isinstance(call.error, deadline.DeadlineExceeded):
+                return self.do(key, func)
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
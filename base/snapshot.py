@@ -0,0 +1,81 @@
+"""On-disk snapshots of the game-data catalog.
+
+One file per server version, ``catalog-<version>.json``, in the user cache
+directory (``platformdirs`` is used when installed, otherwise the usual
+per-platform location). Writing a snapshot removes those of other versions.
+"""
+
+import glob
+import os
+import re
+import sys
+
+from base import codec
+
+try:
+    import platformdirs
+except ImportError:
+    platformdirs = None
+
+
+APP_NAME = 'artifactsmmo-client'
+FORMAT = 1
+
+
+def cache_dir():
+    if platformdirs is not None:
+        return platformdirs.user_cache_dir(APP_NAME)
+
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+
+    return os.path.join(base, APP_NAME)
+
+
+def path_for(version, directory=None):
+    safe_version = re.sub(r'[^\w.-]', '_', str(version))
+
+    return os.path.join(directory or cache_dir(), f'catalog-{safe_version}.json')
+
+
+def load_latest(directory=None):
+    """Newest readable snapshot in the cache directory, or None."""
+
+    paths = glob.glob(os.path.join(directory or cache_dir(), 'catalog-*.json'))
+    for path in sorted(paths, key=os.path.getmtime, reverse=True):
+        try:
+            with open(path, 'rb') as fh:
+                snapshot = codec.loads(fh.read())
+        except (OSError, ValueError):
+            continue
+
+        if isinstance(snapshot, dict) and snapshot.get('format') == FORMAT:
+            return snapshot
+
+    return None
+
+
+def save(snapshot, directory=None):
+    """Write a snapshot for its version and drop snapshots of other versions."""
+
+    directory = directory or cache_dir()
+    os.makedirs(directory, exist_ok=True)
+
+    path = path_for(snapshot['version'], directory)
+    temporary = path + '.tmp'
+    with open(temporary, 'wb') as fh:
+        fh.write(codec.dumps({**snapshot, 'format': FORMAT}))
+    os.replace(temporary, path)
+
+    for other in glob.glob(os.path.join(directory, 'catalog-*.json')):
+        if other != path:
+            try:
+                os.remove(other)
+            except OSError:
+                pass
+
+    return path
@@ -0,0 +1,268 @@
+"""Local stand-in for the game API, shared by the benchmark scripts.
+
+A stdlib ``ThreadingHTTPServer`` that answers from a table of routes, with
+an optional per-request latency and optional TLS (a throwaway self-signed
+certificate made with the ``openssl`` command line tool). It also builds
+the catalog payloads the benchmarks decode and page through, so every run
+works on the same data without fixture files.
+"""
+
+import json
+import os
+import random
+import re
+import shutil
+import socket
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+from base.base import BaseGameClient
+from base.display import Display
+
+ITEM_TYPES = ['resource', 'weapon', 'helmet', 'body_armor', 'consumable', 'ring', 'amulet', 'boots']
+SKILLS = ['weaponcrafting', 'gearcrafting', 'jewelrycrafting', 'cooking', 'alchemy']
+
+
+def make_items(count=3000, seed=1):
+    """/items records shaped like the API's, a third of them craftable."""
+
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        craft = None
+        if i % 3 == 0:
+            craft = {
+                'skill': rng.choice(SKILLS), 'level': rng.randint(1, 40), 'quantity': 1,
+                'items': [{'code': f'item_{rng.randrange(count)}', 'quantity': rng.randint(1, 6)}],
+            }
+
+        items.append({
+            'name': f'Item {i}', 'code': f'item_{i}', 'level': rng.randint(1, 50),
+            'type': rng.choice(ITEM_TYPES), 'subtype': rng.choice(['', 'mining', 'bar', 'food']),
+            'description': 'Something found, made or dropped in the world of Artifacts.',
+            'conditions': [{'code': 'level', 'operator': 'gt', 'value': rng.randint(1, 40)}],
+            'effects': [{'code': 'attack_fire', 'value': rng.randint(1, 30), 'description': 'Adds fire damage'}],
+            'craft': craft, 'tradeable': rng.random() < 0.8,
+        })
+
+    return items
+
+
+def make_maps(count=2400, width=60):
+    """/maps cells on a width-wide grid, every fifth one with a resource on it."""
+
+    cells = []
+    for i in range(count):
+        content = {'type': 'resource', 'code': f'resource_{i % 20}'} if i % 5 == 0 else None
+        cells.append({
+            'map_id': i, 'name': f'Map {i}', 'skin': f'forest_{i % 5}',
+            'x': i % width - width // 2, 'y': i // width - 20, 'layer': 'overworld',
+            'access': {'type': 'standard', 'conditions': []},
+            'interactions': {'content': content, 'transition': None},
+        })
+
+    return cells
+
+
+def make_character(name='hero', inventory_slots=20, **fields):
+    """A character block, with inventory_slots filled slots."""
+
+    character = {
+        'name': name, 'account': 'bench', 'skin': 'men1', 'level': 10, 'xp': 50, 'max_xp': 500,
+        'gold': 1000, 'speed': 0, 'hp': 300, 'max_hp': 300, 'haste': 0, 'critical_strike': 0,
+        'x': 0, 'y': 0, 'layer': 'overworld', 'map_id': 0, 'cooldown': 0,
+        'cooldown_expiration': '2020-01-01T00:00:00Z', 'weapon_slot': 'copper_dagger',
+        'task': '', 'task_type': '', 'task_progress': 0, 'task_total': 0,
+        'inventory_max_items': 100,
+        'inventory': [
+            {'slot': i + 1, 'code': f'item_{i}', 'quantity': 3} for i in range(inventory_slots)
+        ],
+    }
+    for skill in ('mining', 'woodcutting', 'fishing', *SKILLS):
+        character[f'{skill}_level'] = 5
+        character[f'{skill}_xp'] = 10
+        character[f'{skill}_max_xp'] = 100
+
+    character.update(fields)
+    return character
+
+
+def paginate(rows, query):
+    """One page of rows as the API sends it, for ?page= and ?size=."""
+
+    page = int(query.get('page', ['1'])[0])
+    size = int(query.get('size', ['50'])[0])
+    return {
+        'data': rows[(page - 1) * size:page * size], 'total': len(rows),
+        'page': page, 'size': size, 'pages': max(1, -(-len(rows) // size)),
+    }
+
+
+class StandIn:
+    """A running stand-in server.
+
+    ``routes`` maps a regular expression on the path to
+    ``handler(query) -> payload``; anything else answers ``{'data': {}}``.
+    ``latency`` is slept before every answer, ``requests`` counts them.
+    """
+
+    def __init__(self, routes=None, latency=0.0, tls=False):
+        self.routes = [(re.compile(pattern), handler) for pattern, handler in (routes or {}).items()]
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._certificates = None
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self.server.daemon_threads = True
+        scheme = 'http'
+        if tls:
+            self.server.socket = self._tls_context().wrap_socket(self.server.socket, server_side=True)
+            scheme = 'https'
+
+        self.url = f'{scheme}://127.0.0.1:{self.server.server_port}'
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def _tls_context(self):
+        if shutil.which('openssl') is None:
+            raise SystemExit('TLS stand-in needs the openssl command line tool')
+
+        self._certificates = tempfile.TemporaryDirectory()
+        cert = os.path.join(self._certificates.name, 'cert.pem')
+        key = os.path.join(self._certificates.name, 'key.pem')
+        subprocess.run(
+            ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+             '-subj', '/CN=127.0.0.1', '-keyout', key, '-out', cert],
+            check=True, capture_output=True,
+        )
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+        return context
+
+    def _handler_class(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def setup(self):
+                super().setup()
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def _answer(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                if length:
+                    self.rfile.read(length)
+
+                with standin._lock:
+                    standin.requests += 1
+                if standin.latency:
+                    time.sleep(standin.latency)
+
+                url = urlparse(self.path)
+                payload = {'data': {}}
+                for pattern, handler in standin.routes:
+                    if pattern.fullmatch(url.path):
+                        payload = handler(parse_qs(url.query))
+                        break
+
+                body = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = _answer
+
+        return Handler
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self._certificates is not None:
+            self._certificates.cleanup()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class QuietDisplay(Display):
+    """A display that shows nothing and answers every prompt with the default."""
+
+    def _output(self, text):
+        pass
+
+    def _show_window(self, title, text):
+        pass
+
+    def _update_char_info(self, text):
+        pass
+
+    def _update_location_text(self, text):
+        pass
+
+    def print(self, *args, **kwargs):
+        pass
+
+    def input(self, prompt=''):
+        return ''
+
+    def prompt_int(self, prompt, min_val=None, max_val=None):
+        return None
+
+    def prompt_str(self, prompt, allow_empty=True):
+        return ''
+
+    def prompt_yes_no(self, prompt):
+        return False
+
+    def show_image(self, category, key):
+        pass
+
+    def show_basic_actions(self, location_type):
+        pass
+
+    def show_advanced_actions(self):
+        pass
+
+    def show_character_actions(self):
+        pass
+
+
+@contextmanager
+def config(**general):
+    """Point the clients at a throwaway config.ini holding the given [General] keys."""
+
+    general.setdefault('TOKEN', 'bench')
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'config.ini')
+        with open(path, 'w') as fh:
+            fh.write('[General]\n')
+            for key, value in general.items():
+                fh.write(f'{key} = {value}\n')
+
+        with mock.patch.object(BaseGameClient, 'CONFIG_PATH', path):
+            yield path
+
+
+def timed(func, runs):
+    """Mean seconds per call of func over runs calls."""
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs
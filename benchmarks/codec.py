@@ -0,0 +1,50 @@
+"""Decode and encode times of large catalog bodies: stdlib json vs base.codec.
+
+The bodies are single pages of /items (3000 records) and /maps (2400
+cells), generated by ``benchmarks._standin`` in the API's shape.
+``base.codec`` uses orjson or msgspec when installed and falls back to
+json otherwise, in which case both columns measure the same thing.
+``--write DIR`` also saves the two bodies as items.json and maps.json.
+
+Run from the repository root with ``python -m benchmarks.codec``.
+"""
+
+import argparse
+import json
+import os
+
+from base import codec
+from benchmarks._standin import make_items, make_maps, paginate, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=30)
+    parser.add_argument('--write', metavar='DIR', help='also save the generated bodies here')
+    args = parser.parse_args()
+
+    bodies = {
+        '/items': json.dumps(paginate(make_items(), {'size': ['10000']})).encode(),
+        '/maps': json.dumps(paginate(make_maps(), {'size': ['10000']})).encode(),
+    }
+    if args.write:
+        os.makedirs(args.write, exist_ok=True)
+        for url, body in bodies.items():
+            with open(os.path.join(args.write, url.strip('/') + '.json'), 'wb') as fh:
+                fh.write(body)
+
+    print(f'base.codec backend: {codec.NAME}, {args.runs} runs')
+    for url, body in bodies.items():
+        before = timed(lambda: json.loads(body), args.runs)
+        after = timed(lambda: codec.loads(body), args.runs)
+        print(f'  decode {url:7} {len(body) / 1e6:.1f} MB  json {before * 1e3:6.1f} ms  '
+              f'{codec.NAME} {after * 1e3:6.1f} ms')
+
+    page = json.loads(bodies['/items'])
+    before = timed(lambda: json.dumps(page).encode(), args.runs)
+    after = timed(lambda: codec.dumps(page), args.runs)
+    print(f'  encode /items          json {before * 1e3:6.1f} ms  {codec.NAME} {after * 1e3:6.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
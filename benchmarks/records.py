@@ -0,0 +1,72 @@
+"""Catalog memory: decoded JSON dicts vs the slotted records of base.records.
+
+Loads 3000 items and 2400 map cells into a Catalog twice, once keeping the
+dicts as decoded (as before) and once compacted into ``base.records``
+types, and reports what tracemalloc sees still allocated afterwards. Also
+times loading the same snapshot both ways and checks that both catalogs
+write out identical snapshots.
+
+Run from the repository root with ``python -m benchmarks.records``.
+"""
+
+import argparse
+import time
+import tracemalloc
+from unittest import mock
+
+from base import catalog as catalog_module
+from base import codec
+from base.catalog import Catalog
+from benchmarks._standin import make_items, make_maps
+
+
+def load(payload, compact):
+    """A Catalog filled from payload, and the bytes it keeps allocated."""
+
+    record_types = catalog_module.RECORD_TYPES if compact else {}
+    with mock.patch.object(catalog_module, 'RECORD_TYPES', record_types):
+        tracemalloc.start()
+        data = codec.loads(payload)
+        catalog = Catalog()
+        catalog.replace('items', data['items'])
+        catalog.replace('maps', data['maps'])
+        del data
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return catalog, size
+
+
+def load_time(snapshot, compact, runs):
+    record_types = catalog_module.RECORD_TYPES if compact else {}
+    with mock.patch.object(catalog_module, 'RECORD_TYPES', record_types):
+        started = time.perf_counter()
+        for _ in range(runs):
+            Catalog().load_snapshot(snapshot)
+        return (time.perf_counter() - started) / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=3000)
+    parser.add_argument('--maps', type=int, default=2400)
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    payload = codec.dumps({'items': make_items(args.items), 'maps': make_maps(args.maps)})
+
+    plain, plain_size = load(payload, compact=False)
+    slotted, slotted_size = load(payload, compact=True)
+    snapshot = plain.to_snapshot()
+    assert codec.loads(codec.dumps(slotted.to_snapshot())) == codec.loads(codec.dumps(snapshot)), \
+        'slotted records write a different snapshot'
+
+    print(f'{args.items} items + {args.maps} map cells')
+    print(f'  memory         dicts {plain_size / 1e6:6.2f} MB  records {slotted_size / 1e6:6.2f} MB  '
+          f'({100 * (slotted_size / plain_size - 1):+.0f}%)')
+    print(f'  snapshot load  dicts {load_time(snapshot, False, args.runs) * 1e3:6.1f} ms  '
+          f'records {load_time(snapshot, True, args.runs) * 1e3:6.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Cost of ``Character.refresh()`` once the response is in.
+
+Before, ``_get_character_info`` called ``response.json()`` (a full decode
+of the body) twice for every character field. Now the body is decoded
+once into an ApiResponse and only the fields that changed are applied.
+Both paths get the same canned 100-slot character response, so only the
+client-side work is timed, not the network.
+
+Run from the repository root with ``python -m benchmarks.refresh``.
+"""
+
+import argparse
+import json
+
+import requests
+
+from base.base import BaseGameClient
+from base.character import Character
+from base.response import ApiResponse
+from benchmarks._standin import QuietDisplay, StandIn, config, make_character, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=2000)
+    parser.add_argument('--slots', type=int, default=100)
+    args = parser.parse_args()
+
+    block = make_character('hero', inventory_slots=args.slots, inventory_max_items=args.slots * 10)
+    body = json.dumps({'data': block}).encode()
+
+    def raw_response():
+        response = requests.Response()
+        response.status_code = 200
+        response.encoding = 'utf-8'
+        response._content = body
+        return response
+
+    with StandIn({r'/characters/hero': lambda query: {'data': block}}) as server, config():
+        parent = BaseGameClient()
+        parent.base_url = server.url
+        character = Character('hero', parent=parent, display=QuietDisplay())
+
+    def refresh_before():
+        response = raw_response()
+        for key in Character.CHARACTER_INFO_FIELDS:
+            if key in response.json().get('data', {}):
+                setattr(character.state, key, response.json()['data'][key])
+
+    character._get_with_reauth = lambda url, data=None: ApiResponse(raw_response())
+
+    before = timed(refresh_before, args.runs)
+    after = timed(character.refresh, args.runs)
+
+    print(f'refresh() of a {args.slots}-slot character, {args.runs} runs')
+    print(f'  json() per field   {before * 1e6:8.0f} us')
+    print(f'  decode once, diff  {after * 1e6:8.0f} us  ({before / after:.0f}x)')
+
+
+if __name__ == '__main__':
+    main()
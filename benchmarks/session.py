@@ -0,0 +1,47 @@
+"""Per-call latency: a new connection per request vs the client's pooled session.
+
+Before, every call went through ``requests.request``, which opens (and
+TLS-handshakes) a fresh connection each time. Now all calls share the
+client's keep-alive ``requests.Session``. Both are timed doing sequential
+GETs against a local TLS stand-in server.
+
+Run from the repository root with ``python -m benchmarks.session``.
+"""
+
+import argparse
+
+import requests
+import urllib3
+
+from base.base import BaseClient
+from base.ratelimit import RateLimiter
+from benchmarks._standin import StandIn, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=300)
+    parser.add_argument('--plain', action='store_true', help='plain HTTP instead of TLS')
+    args = parser.parse_args()
+
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    with StandIn(tls=not args.plain) as server:
+        client = BaseClient()
+        client.base_url = server.url
+        client.session.verify = False
+        client.session.trust_env = False
+        # Pacing is not what is measured here.
+        client.rate_limiter = RateLimiter({RateLimiter.DATA: 10 ** 6})
+
+        url = server.url + '/status'
+        before = timed(lambda: requests.request('get', url, verify=False), args.calls)
+        after = timed(lambda: client._get('/status'), args.calls)
+        client.close()
+
+    print(f'{args.calls} sequential GETs over {"HTTP" if args.plain else "TLS"}')
+    print(f'  requests.request  {before * 1000:7.2f} ms per call')
+    print(f'  pooled session    {after * 1000:7.2f} ms per call  ({before / after:.0f}x)')
+
+
+if __name__ == '__main__':
+    main()
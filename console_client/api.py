@@ -30,6 +30,18 @@ class ConsoleDisplay(Display):
     def clear_action_countdown(self):
         print(' ' * 40, end='\r')
 
+    def show_catalog_progress(self, name, done, total):
+        if done == total:
+            print('Game data loaded.')
+
+    def show_map_changes(self, changes):
+        for line in self._format_map_changes(changes):
+            print(line)
+
+    def show_character_changes(self, character, changes):
+        for line in self._format_character_changes(character, changes):
+            print(line)
+
     def input(self, prompt=''):
         return input(prompt)
 
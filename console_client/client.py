@@ -32,7 +32,9 @@ class ConsoleGameClient(GameClient):
     def main_loop(self):
         """Top-level menu: account-level actions plus character selection."""
 
+        self.warm_up_catalog()
         self.show_current_season()
+        self.start_map_sync()
 
         while True:
             actions_map, actions_str = self.display.prepare_menu(ActionTypeEnum.ACCOUNT_ACTIONS)
@@ -173,13 +175,10 @@ class ConsoleGameClient(GameClient):
         self.display.show_skills(self.character)
 
     def _show_character_inventory(self):
-        inventory = getattr(self.character, 'inventory', None) or []
-        unique_codes = set(slot.get('code') for slot in inventory if slot.get('code'))
+        unique_codes = set(self.character.inventory_index.codes())
         self.display.print('Loading items data...', end='\r')
-        item_names = {}
-        for item_code in unique_codes:
-            item = self.get_item(item_code)
-            item_names[item_code] = (item or {}).get('name', item_code)
+        items = self.get_items_by_codes(unique_codes)
+        item_names = {code: items.get(code, {}).get('name', code) for code in unique_codes}
         self.display.show_inventory(self.character, item_names)
 
     def _show_character_equipment(self):
@@ -195,9 +194,7 @@ class ConsoleGameClient(GameClient):
                 unique_codes.add(item_code)
 
         self.display.print('Loading items data...', end='\r')
-        items_data = {}
-        for code in unique_codes:
-            items_data[code] = self.get_item(code)
+        items_data = self.get_items_by_codes(unique_codes)
         self.display.show_equipment(self.character, effect_names, items_data)
 
     # ── Character selection ─────────────────────────────────────
@@ -265,8 +262,9 @@ class ConsoleGameClient(GameClient):
         if response.status_code != 200:
             sys.exit('Can\'t reach the server. Please try again later.')
 
-        data = response.json().get('data', {})
+        data = response.data or {}
         self.display.print(f'Game version: {data.get("version", "?")}.')
+        self.sync_catalog(data.get('version'))
 
         season = data.get('season') or {}
         name = season.get('name', '?')
@@ -325,7 +323,7 @@ class ConsoleGameClient(GameClient):
             self.display.print(f'Character {name} successfully deleted.')
             return True
 
-        if error_block := response.json().get('error'):
+        if error_block := response.error:
             self.display.print(error_block.get('message', 'Unknown error.'))
 
         return False
@@ -352,7 +350,7 @@ class ConsoleGameClient(GameClient):
             self.display.print('Password changed. Note: your token has been reset, update config.ini.')
             return
 
-        if error_block := response.json().get('error'):
+        if error_block := response.error:
             self.display.print(error_block.get('message', 'Unknown error.'))
 
     def login_with_password(self):
@@ -577,15 +575,12 @@ class ConsoleGameClient(GameClient):
         if chosen_item_idx is None:
             return
 
-        self._do_recycle(inventory, inventory_map, chosen_item_idx)
+        self._do_recycle(inventory_map, chosen_item_idx)
 
-    def _do_recycle(self, inventory, inventory_map, chosen_item_idx):
+    def _do_recycle(self, inventory_map, chosen_item_idx):
         chosen_label = inventory_map[chosen_item_idx]
         item_code = chosen_label.split(' (')[0]
-        max_qty = next(
-            (s.get('quantity', 1) for s in inventory if s['code'] == item_code),
-            1,
-        )
+        max_qty = self.character.inventory_index.quantity(item_code) or 1
         quantity = self._prompt_int(f'How many do you want to recycle (max {max_qty})?: ', min_val=1)
         if quantity is None:
             return
@@ -600,7 +595,7 @@ class ConsoleGameClient(GameClient):
         if skill:
             response = self._get_with_reauth(url='/maps', data={'content_code': skill, 'size': 1})
             if response.status_code == 200:
-                data = response.json().get('data', [])
+                data = response.data or []
                 if data:
                     loc = data[0]
                     self.character.move(loc['x'], loc['y'])
@@ -680,11 +675,7 @@ class ConsoleGameClient(GameClient):
 
         quantity = None
         if equip_slot in ('utility1', 'utility2'):
-            inv_qty = next(
-                (s.get('quantity', 1) for s in (self.character.inventory or [])
-                 if s.get('code') == item_code),
-                1,
-            )
+            inv_qty = self.character.inventory_index.quantity(item_code) or 1
             qty = self._prompt_int(f'How many to equip (max {inv_qty})?: ', min_val=1)
             if qty is not None:
                 quantity = qty
@@ -722,14 +713,11 @@ class ConsoleGameClient(GameClient):
         if chosen_item_idx is None:
             return
 
-        self._do_use_item(inventory, inventory_map, chosen_item_idx)
+        self._do_use_item(inventory_map, chosen_item_idx)
 
-    def _do_use_item(self, inventory, inventory_map, chosen_item_idx):
+    def _do_use_item(self, inventory_map, chosen_item_idx):
         item_code = inventory_map[chosen_item_idx]
-        max_qty = next(
-            (s.get('quantity', 1) for s in inventory if s['code'] == item_code),
-            1,
-        )
+        max_qty = self.character.inventory_index.quantity(item_code) or 1
         quantity = self._prompt_int(f'How many do you want to use (max {max_qty})?: ', min_val=1)
         if quantity is None:
             return
@@ -753,15 +741,12 @@ class ConsoleGameClient(GameClient):
         if chosen_item_idx is None:
             return
 
-        self._do_delete_item(inventory, inventory_map, chosen_item_idx)
+        self._do_delete_item(inventory_map, chosen_item_idx)
 
-    def _do_delete_item(self, inventory, inventory_map, chosen_item_idx):
+    def _do_delete_item(self, inventory_map, chosen_item_idx):
         chosen_label = inventory_map[chosen_item_idx]
         item_code = chosen_label.split(' (')[0]
-        max_qty = next(
-            (s.get('quantity', 1) for s in inventory if s['code'] == item_code),
-            1,
-        )
+        max_qty = self.character.inventory_index.quantity(item_code) or 1
         quantity = self._prompt_int(f'How many do you want to delete (max {max_qty})?: ', min_val=1)
         if quantity is None:
             return
@@ -861,14 +846,11 @@ class ConsoleGameClient(GameClient):
         if idx is None:
             return
 
-        self._do_npc_sell(inventory, items_map, idx)
+        self._do_npc_sell(items_map, idx)
 
-    def _do_npc_sell(self, inventory, items_map, idx):
+    def _do_npc_sell(self, items_map, idx):
         item_code = items_map[idx]
-        max_qty = next(
-            (s.get('quantity', 1) for s in inventory if s['code'] == item_code),
-            1,
-        )
+        max_qty = self.character.inventory_index.quantity(item_code) or 1
         qty = self._prompt_int(f'How many (max {max_qty})?: ', min_val=1)
         if qty is None:
             return
@@ -895,14 +877,11 @@ class ConsoleGameClient(GameClient):
         if chosen_item_idx is None:
             return
 
-        self._do_deposit_item(inventory, inventory_map, chosen_item_idx)
+        self._do_deposit_item(inventory_map, chosen_item_idx)
 
-    def _do_deposit_item(self, inventory, inventory_map, chosen_item_idx):
+    def _do_deposit_item(self, inventory_map, chosen_item_idx):
         item_code = inventory_map[chosen_item_idx]
-        max_qty = next(
-            (s.get('quantity', 1) for s in inventory if s['code'] == item_code),
-            1,
-        )
+        max_qty = self.character.inventory_index.quantity(item_code) or 1
         quantity = self._prompt_int(f'How many do you want to deposit (max {max_qty})?: ', min_val=1)
         if quantity is None:
             return
@@ -1019,14 +998,11 @@ class ConsoleGameClient(GameClient):
         if iidx is None:
             return
 
-        self._finish_give_item(inventory, items_map, iidx, target)
+        self._finish_give_item(items_map, iidx, target)
 
-    def _finish_give_item(self, inventory, items_map, iidx, target):
+    def _finish_give_item(self, items_map, iidx, target):
         item_code = items_map[iidx]
-        max_qty = next(
-            (s.get('quantity', 1) for s in inventory if s['code'] == item_code),
-            1,
-        )
+        max_qty = self.character.inventory_index.quantity(item_code) or 1
         qty = self._prompt_int(f'How many (max {max_qty})?: ', min_val=1)
         if qty is None:
             return
@@ -1073,14 +1049,11 @@ class ConsoleGameClient(GameClient):
         if idx is None:
             return
 
-        self._do_ge_create_sell_order(inventory, items_map, idx)
+        self._do_ge_create_sell_order(items_map, idx)
 
-    def _do_ge_create_sell_order(self, inventory, items_map, idx):
+    def _do_ge_create_sell_order(self, items_map, idx):
         item_code = items_map[idx]
-        max_qty = next(
-            (s.get('quantity', 1) for s in inventory if s['code'] == item_code),
-            1,
-        )
+        max_qty = self.character.inventory_index.quantity(item_code) or 1
         qty = self._prompt_int(f'How many to sell (max {max_qty})?: ', min_val=1)
         if qty is None:
             return
@@ -2,4 +2,8 @@ from console_client.api import GameClient
 
 if __name__ == '__main__':
     client = GameClient()
-    client.main_loop()
+    try:
+        client.main_loop()
+    finally:
+        client.dump_metrics()
+        client.close()
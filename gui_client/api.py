@@ -82,24 +82,29 @@ class GUIDisplay(Display):
     def hide_loading(self):
         self.app.after(0, self.app._hide_loading)
 
+    def show_catalog_progress(self, name, done, total):
+        self.app.after(0, lambda: self.app._show_catalog_progress(name, done, total))
+
+    def show_map_changes(self, changes):
+        for line in self._format_map_changes(changes):
+            self.app.log(line)
+
+        current = self.app.current_location_data or {}
+        for change in changes:
+            if change.new is not None and change.map_id == current.get('map_id'):
+                self.show_location(change.new)
+
+    def show_character_changes(self, character, changes):
+        if character is not getattr(self.app, 'character', None):
+            return
+        for line in self._format_character_changes(character, changes):
+            self.app.log(line)
+        self.app.after(0, lambda: self.app._refresh_changed_tabs(changes))
+
     def show_action_details(self, source):
         self._pending_details = self._format_action_details(source)
-        character_data = source.get('character', {}) or {}
-        if character_data:
-            char = getattr(self.app, 'character', None)
-            if char is not None:
-                for key in char.CHARACTER_INFO_FIELDS:
-                    if key in character_data:
-                        setattr(char, key, character_data[key])
-                self.show_character_info_panel(char)
-            pos = {}
-            if 'x' in character_data:
-                pos['x'] = character_data['x']
-            if 'y' in character_data:
-                pos['y'] = character_data['y']
-            if 'layer' in character_data:
-                pos['layer'] = character_data['layer']
-            self.app._on_action_completed(pos)
+        if source.get('character'):
+            self.app._on_action_completed()
 
     def show_action_log(self, description):
         if getattr(self, '_pending_details', None) is not None:
@@ -246,8 +251,12 @@ class App(ctk.CTk):
         self.container = ctk.CTkFrame(self)
         self.container.pack(fill='both', expand=True)
 
+        self.catalog_status = ctk.CTkLabel(self, text='', text_color='gray', font=('', 11))
+
         self._set_window_icon()
 
+        # Once mainloop runs, so the warm-up's progress reports can reach the window.
+        self.after(0, self.client.warm_up_catalog)
         threading.Thread(target=self._init_flow, daemon=True).start()
 
     def _set_window_icon(self):
@@ -270,6 +279,8 @@ class App(ctk.CTk):
             self.log('Server unreachable. Check your connection.')
             return
 
+        self.client.start_map_sync()
+
         characters = self.client.get_my_characters()
         if characters:
             self._show_account_menu(characters)
@@ -359,7 +370,7 @@ class App(ctk.CTk):
             self.after(0, lambda: status_label.configure(text=msg))
 
         if response.status_code == 200:
-            token = response.json().get('token')
+            token = response.payload.get('token')
             if not token:
                 fail('Server returned empty token.')
                 return
@@ -630,12 +641,13 @@ class App(ctk.CTk):
         self.button_frame.grid(row=0, column=0, sticky='ew')
         self._refresh_action_buttons()
 
+        # Cooldown bar, under the buttons so they stay usable while it runs
         self.action_progress = ctk.CTkProgressBar(
             self.action_container, orientation='horizontal',
-            height=28, mode='determinate',
+            height=12, mode='determinate',
             progress_color='#3498db',
         )
-        self.action_progress.grid(row=0, column=0, sticky='ew')
+        self.action_progress.grid(row=1, column=0, sticky='ew', pady=(5, 0))
         self.action_progress.grid_remove()
 
     # ──────────────── tab refresh methods ────────────────────────
@@ -657,6 +669,25 @@ class App(ctk.CTk):
         threading.Thread(target=self._refresh_inventory_tab, daemon=True).start()
         threading.Thread(target=self._refresh_equipment_tab, daemon=True).start()
 
+    def _refresh_changed_tabs(self, changes):
+        """Redraw only the panels and tabs showing the changed character fields."""
+
+        if not self.character:
+            return
+        if {'hp', 'xp', 'appearance'} & changes.groups:
+            self.client.display.show_character_info_panel(self.character)
+        if {'hp', 'xp', 'stats'} & changes.groups:
+            self._refresh_stats_tab()
+        if 'skills' in changes:
+            self._refresh_skills_tab()
+        if 'inventory' in changes:
+            threading.Thread(target=self._refresh_inventory_tab, daemon=True).start()
+        if 'equipment' in changes:
+            threading.Thread(target=self._refresh_equipment_tab, daemon=True).start()
+        if 'position' in changes and not getattr(self, '_batch_mode', False):
+            position = {'layer': self.character.layer, 'x': self.character.x, 'y': self.character.y}
+            threading.Thread(target=self._refresh_location_data, args=(position,), daemon=True).start()
+
     def _refresh_stats_tab(self):
         c = self.character
         lines = [
@@ -719,17 +750,13 @@ class App(ctk.CTk):
         if not self.character:
             return
         inventory = getattr(self.character, 'inventory', None) or []
-        total = sum(s.get('quantity', 0) for s in inventory if s.get('code'))
-        slots = sum(1 for s in inventory if s.get('code'))
-        max_items = getattr(self.character, 'inventory_max_items', 0)
-        unique_codes = set(s['code'] for s in inventory if s.get('code'))
+        index = self.character.inventory_index
+        unique_codes = set(index.codes())
 
-        item_names = {}
-        for code in unique_codes:
-            item = self.client.get_item(code)
-            item_names[code] = (item or {}).get('name', code)
+        items = self.client.get_items_by_codes(unique_codes)
+        item_names = {code: items.get(code, {}).get('name', code) for code in unique_codes}
 
-        lines = [f'Fill: {total}/{max_items} (slots: {slots})']
+        lines = [f'Fill: {index.total}/{index.max_items} (slots: {index.used_slots})']
         for slot in inventory:
             code = slot.get('code')
             if not code:
@@ -752,9 +779,7 @@ class App(ctk.CTk):
                 unique_codes.add(item_code)
 
         from base.enums import EquipmentSlotsEnum
-        items_data = {}
-        for code in unique_codes:
-            items_data[code] = self.client.get_item(code)
+        items_data = self.client.get_items_by_codes(unique_codes)
 
         lines = []
         for slot_name in EquipmentSlotsEnum:
@@ -909,7 +934,6 @@ class App(ctk.CTk):
         if not hasattr(self, 'loading_label') or not self.loading_label.winfo_exists():
             return
         self.button_frame.grid_remove()
-        self.action_progress.grid_remove()
         self.loading_label.grid()
 
     def _hide_loading(self):
@@ -919,50 +943,44 @@ class App(ctk.CTk):
         if not getattr(self, '_batch_mode', False):
             self.button_frame.grid()
 
+    def _show_catalog_progress(self, name, done, total):
+        if done < total:
+            self.catalog_status.configure(text=f'Loading game data... {done}/{total} ({name} ready)')
+            if not self.catalog_status.winfo_ismapped():
+                self.catalog_status.pack(side='bottom', fill='x', before=self.container)
+        else:
+            self.catalog_status.pack_forget()
+
     def _start_action_progress(self, total_seconds):
         if not hasattr(self, 'action_progress') or not self.action_progress.winfo_exists():
             return
-        if not getattr(self, '_batch_mode', False):
-            self.button_frame.grid_remove()
         self._action_total = total_seconds
-        self.action_progress.set(0)
-        self.action_progress.grid()
         self._start_action_timer()
 
-    def _tick_action_progress(self):
+    def _tick_action_progress(self, run):
         if not hasattr(self, 'action_progress') or not self.action_progress.winfo_exists():
             return
+        if run != self._action_run:
+            return
         self._action_elapsed += 1
         pct = min(1.0, self._action_elapsed / max(1, self._action_total))
         self.action_progress.set(pct)
         if pct < 1.0:
-            self.after(1000, self._tick_action_progress)
+            self.after(1000, lambda: self._tick_action_progress(run))
+        else:
+            self.action_progress.grid_remove()
 
     def _finish_action_progress(self):
         if not hasattr(self, 'action_progress') or not self.action_progress.winfo_exists():
             return
-        self.action_progress.set(1.0)
-        self.action_progress.grid_remove()
         if getattr(self, '_batch_mode', False):
             self._batch_done += 1
-            if self._batch_done >= self._batch_count:
-                return
-            self.action_progress.grid()
-            self.action_progress.set(0)
-            self._start_action_timer()
             return
         self.button_frame.grid()
         self._refresh_action_buttons()
 
-    def _on_action_completed(self, new_position=None):
+    def _on_action_completed(self):
         self.after(0, self._finish_action_progress)
-        self.after(0, self._refresh_all_tabs)
-        if new_position and not getattr(self, '_batch_mode', False):
-            threading.Thread(
-                target=self._refresh_location_data,
-                args=(new_position,),
-                daemon=True,
-            ).start()
 
     def _start_batch(self, total_count):
         self._batch_mode = True
@@ -973,7 +991,6 @@ class App(ctk.CTk):
 
     def _end_batch(self):
         self._batch_mode = False
-        self.action_progress.grid_remove()
         self.button_frame.grid()
         self._refresh_action_buttons()
         self.after(0, self._refresh_all_tabs)
@@ -983,10 +1000,11 @@ class App(ctk.CTk):
     def _start_action_timer(self):
         if not hasattr(self, 'action_progress') or not self.action_progress.winfo_exists():
             return
+        self._action_run = getattr(self, '_action_run', 0) + 1
         self._action_elapsed = 0
         self.action_progress.set(0)
         self.action_progress.grid()
-        self._tick_action_progress()
+        self._tick_action_progress(self._action_run)
 
     def _refresh_location_data(self, new_position):
         layer = new_position.get('layer', '')
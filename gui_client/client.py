@@ -22,8 +22,9 @@ class GUIClient(GameClient):
             self.display.print('Can\'t reach the server. Please try again later.')
             return
 
-        data = response.json().get('data', {})
+        data = response.data or {}
         self.display.print(f'Game version: {data.get("version", "?")}.')
+        self.sync_catalog(data.get('version'))
 
         season = data.get('season') or {}
         name = season.get('name', '?')
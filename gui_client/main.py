@@ -5,4 +5,8 @@ from gui_client.api import App
 
 if __name__ == '__main__':
     app = App()
-    app.mainloop()
+    try:
+        app.mainloop()
+    finally:
+        app.client.dump_metrics()
+        app.client.close()
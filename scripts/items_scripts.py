@@ -1,3 +1,5 @@
+from base.catalog import nearest_cell
+from base.deadline import DeadlineExceeded, deadline
 from base.enums import MapTypesEnum
 
 
@@ -23,21 +25,32 @@ def _prompt_int(prompt, min_val=None, max_val=None, display=None):
 
 def _inventory_quantity(character, item_code):
     """Total quantity of item_code in the character's inventory."""
-    for slot in character.inventory or []:
-        if slot.get('code') == item_code:
-            return slot.get('quantity', 0)
+    return character.inventory_index.quantity(item_code)
+
+
+def _catalog(character):
+    """The account client's game-data catalog, or None for a standalone character."""
+    return getattr(character.parent, 'catalog', None)
 
-    return 0
+
+def _catalog_indexes(character):
+    catalog = _catalog(character)
+    return catalog.indexes() if catalog is not None else None
 
 
 def _fetch_item_details(character, item_code):
     """Fetch a single item's full details. Returns dict or None on failure."""
+    catalog = _catalog(character)
+    item = catalog.get('items', item_code) if catalog is not None else None
+    if item is not None:
+        return item
+
     response = character._get(url=f'/items/{item_code}')
 
     if response.status_code != 200:
         return None
 
-    return response.json().get('data', {})
+    return response.data or {}
 
 
 def _fetch_items_by_skill(character, craft_skill, display=None):
@@ -63,14 +76,13 @@ def _fetch_items_by_skill(character, craft_skill, display=None):
     )
 
     if response.status_code != 200:
-        error_block = response.json().get('error', {})
+        error_block = response.error or {}
         display.print(f'Can\'t fetch items: {error_block.get("message", "Unknown error.")}.')
 
         return {}
 
-    body = response.json()
-    data = body.get('data', [])
-    total = body.get('total')
+    data = response.data or []
+    total = response.total
 
     if total and total > len(data):
         display.print(f'Warning: {total} matching items exist but only {len(data)} returned.')
@@ -92,7 +104,19 @@ def _fetch_items_by_skill(character, craft_skill, display=None):
 
 
 def _fetch_location_for_content(character, content_code='', content_type=''):
-    """Find a map cell for given content. Returns (x, y, layer) or None."""
+    """Find a map cell for given content. Returns (x, y, layer) or None.
+
+    With the maps loaded the cell nearest to the character is taken from the
+    client's map cache, active events included, without a request.
+    """
+    parent = character.parent
+    if parent is not None and hasattr(parent, 'map_cache') and parent._sync_map_events():
+        cells = parent.map_cache.find(content_type=content_type, content_code=content_code)
+        location = nearest_cell(cells, character.x, character.y, character.layer)
+        if location is None:
+            return None
+        return (location['x'], location['y'], location.get('layer', 'overworld'))
+
     params = {'size': 1}
 
     if content_code:
@@ -104,7 +128,7 @@ def _fetch_location_for_content(character, content_code='', content_type=''):
     response = character._get(url='/maps', data=params)
 
     if response.status_code == 200:
-        data = response.json().get('data', [])
+        data = response.data or []
 
         if data:
             location = data[0]
@@ -141,12 +165,14 @@ def _fight_loop(character, item_code, quantity):
 
 def _gather_base_item(character, item_code, quantity, display=None):
     """Move to and gather a base resource that has no recipe of its own."""
-    resource_response = character._get(url='/resources', data={'drop': item_code, 'size': 1})
-    resource = None
-
-    if resource_response.status_code == 200:
-        data = resource_response.json().get('data', [])
-        resource = data[0] if data else None
+    indexes = _catalog_indexes(character)
+    if indexes is not None:
+        sources = indexes.sources_of(item_code)
+        resource = next((source for source in sources if source['kind'] == 'resources'), None)
+        monster = next((source for source in sources if source['kind'] == 'monsters'), None)
+    else:
+        resource = _find_drop_source(character, '/resources', item_code)
+        monster = None
 
     if resource:
         location = _fetch_location_for_content(character, content_code=resource['code'])
@@ -158,12 +184,8 @@ def _gather_base_item(character, item_code, quantity, display=None):
 
         return
 
-    monster_response = character._get(url='/monsters', data={'drop': item_code, 'size': 1})
-    monster = None
-
-    if monster_response.status_code == 200:
-        data = monster_response.json().get('data', [])
-        monster = data[0] if data else None
+    if monster is None and indexes is None:
+        monster = _find_drop_source(character, '/monsters', item_code)
 
     if monster:
         location = _fetch_location_for_content(character, content_code=monster['code'])
@@ -178,11 +200,22 @@ def _gather_base_item(character, item_code, quantity, display=None):
     display.print(f'Warning: don\'t know where to get {item_code}.')
 
 
+def _find_drop_source(character, url, item_code):
+    """First resource or monster (per url) that drops item_code, asked from the API."""
+    response = character._get(url=url, data={'drop': item_code, 'size': 1})
+
+    if response.status_code == 200:
+        data = response.data or []
+        return data[0] if data else None
+
+    return None
+
+
 def _fetch_bank_quantity(character, item_code):
     """Check how many of ``item_code`` are in the character's bank."""
     response = character._get(url='/my/bank/items', data={'item_code': item_code})
     if response.status_code == 200:
-        for slot in response.json().get('data', []):
+        for slot in response.data or []:
             if slot.get('code') == item_code:
                 return slot.get('quantity', 0)
     return 0
@@ -202,9 +235,8 @@ def _withdraw_from_bank(character, item_code, needed):
     if bank_qty == 0:
         return 0
 
-    character.move(*bank[:2])
     withdraw_qty = min(bank_qty, needed)
-    character.withdraw_item(item_code, withdraw_qty)
+    character.enqueue('move', *bank[:2]).enqueue('withdraw_item', item_code, withdraw_qty).run_queue()
     return withdraw_qty
 
 
@@ -213,9 +245,9 @@ def _craft_at_workshop(character, item_code, craft_skill, executions):
     workshop = _fetch_location_for_content(character, content_code=craft_skill)
 
     if workshop:
-        character.move(*workshop[:2])
+        character.enqueue('move', *workshop[:2])
 
-    character.crafting(item_code, executions)
+    character.enqueue('crafting', item_code, executions).run_queue()
 
 
 class ItemsScenarios:
@@ -231,6 +263,8 @@ class ItemsScenarios:
 
     MAX_RECIPE_DEPTH = 10
 
+    CONFIG_CRAFT_DEADLINE_KEY = 'CRAFT_DEADLINE'
+
     @staticmethod
     def get_scenarios(character):
         return [ItemsScenarios.craft_any_item]
@@ -330,22 +364,38 @@ class ItemsScenarios:
 
         return items[choice - 1]
 
+    @classmethod
+    def _craft_deadline(cls, character):
+        """Seconds allowed for one craft order (CRAFT_DEADLINE in config.ini), None for no limit."""
+
+        config = getattr(character, 'config', None)
+        if config is None:
+            return None
+
+        seconds = config.getfloat(character.CONFIG_SECTION, cls.CONFIG_CRAFT_DEADLINE_KEY, fallback=0)
+
+        return seconds or None
+
     @classmethod
     def _execute_craft(cls, character, item, quantity, post_craft):
         remaining = quantity
-        while remaining > 0:
-            batch = cls._calc_batch_size(character, item, remaining)
-            if batch == 0:
-                character.display.print(f'Inventory full. Cannot craft {item["code"]}.')
-                break
-            if batch < remaining:
-                character.display.print(f'Inventory space limited: crafting {batch} instead of {remaining} (batch).')
-            craft_per_exec = (item.get('craft') or {}).get('quantity', 1)
-            actual = ((batch + craft_per_exec - 1) // craft_per_exec) * craft_per_exec
-            if actual != batch:
-                character.display.print(f'Recipe produces {craft_per_exec} per batch: crafting {actual} instead of {batch}.')
-            cls._craft_recursive(character, item, actual, depth=0)
-            remaining -= actual
+        try:
+            with deadline(cls._craft_deadline(character)):
+                while remaining > 0:
+                    batch = cls._calc_batch_size(character, item, remaining)
+                    if batch == 0:
+                        character.display.print(f'Inventory full. Cannot craft {item["code"]}.')
+                        break
+                    if batch < remaining:
+                        character.display.print(f'Inventory space limited: crafting {batch} instead of {remaining} (batch).')
+                    craft_per_exec = (item.get('craft') or {}).get('quantity', 1)
+                    actual = ((batch + craft_per_exec - 1) // craft_per_exec) * craft_per_exec
+                    if actual != batch:
+                        character.display.print(f'Recipe produces {craft_per_exec} per batch: crafting {actual} instead of {batch}.')
+                    cls._craft_recursive(character, item, actual, depth=0)
+                    remaining -= actual
+        except DeadlineExceeded:
+            character.display.print(f'Crafting {item["code"]} stopped: {cls.CONFIG_CRAFT_DEADLINE_KEY} reached.')
 
         crafted = quantity - remaining
         if post_craft != 'n' and crafted > 0:
@@ -378,7 +428,7 @@ class ItemsScenarios:
     @classmethod
     def _calc_batch_size(cls, character, item, quantity):
         max_total = getattr(character, 'inventory_max_items', 100)
-        current = sum(s.get('quantity', 0) for s in (character.inventory or []) if s.get('code'))
+        current = character.inventory_index.total
         available = int(max_total * 0.9) - current
         if available <= 0:
             return 0
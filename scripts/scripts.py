@@ -1,6 +1,6 @@
 import functools
 from base.enums import MapTypesEnum, TaskTypeEnum
-from scripts.items_scripts import ItemsScenarios, _prompt_int
+from scripts.items_scripts import ItemsScenarios, _fetch_item_details, _fetch_location_for_content, _prompt_int
 
 
 class _ScenarioHelpers:
@@ -21,31 +21,13 @@ class _ScenarioHelpers:
 
     @classmethod
     def _fetch_location_coordinates(cls, character, content_code='', content_type=''):
-        params = {'size': 1}
-
-        if content_code:
-            params['content_code'] = content_code
-
-        if content_type:
-            params['content_type'] = content_type
-
-        result = None
-        response = character._get(url='/maps', data=params)
-
-        if response.status_code == 200:
-            data = response.json().get('data', [])
-
-            if data:
-                location = data[0]
-                result = (location['x'], location['y'], location.get('layer', 'overworld'))
-
-        return result
+        return _fetch_location_for_content(character, content_code, content_type)
 
     @classmethod
     def _get_location_for_content(cls, character, content_code='', content_type=''):
         location = cls._fetch_location_coordinates(character, content_code, content_type)
 
-        if location is None and (error_block := character._get(url='/maps', data={'size': 1}).json().get('error')):
+        if location is None and (error_block := character._get(url='/maps', data={'size': 1}).error):
             character.display.print(f'Can\'t get location data. {error_block.get("message", "Unknown error.")}.')
 
         return location
@@ -73,8 +55,7 @@ class _ScenarioHelpers:
 
     @classmethod
     def _get_workshop_for_item_code(cls, character, item_code):
-        response = character._get(url=f'/items/{item_code}')
-        item = response.json().get('data', {}) if response.status_code == 200 else {}
+        item = _fetch_item_details(character, item_code) or {}
         craft = item.get('craft') or {}
         skill = craft.get('skill', '')
         if skill:
@@ -169,14 +150,13 @@ class OtherScenarios(_ScenarioHelpers):
 
     @classmethod
     def _deposit_inventory_to_bank(cls, character, bank):
-        character.move(*bank[:2])
+        if not character.enqueue('move', *bank[:2]).run_queue():
+            return
 
-        for slot in list(character.inventory or []):
-            code = slot.get('code')
-            qty = slot.get('quantity', 1)
+        for code, qty in list(character.inventory_index.items()):
+            character.enqueue('deposit_item', code, qty)
 
-            if code and qty:
-                character.deposit_item(code, qty)
+        character.run_queue(stop_on_failure=False)
 
     @classmethod
     def deposit_gold_to_bank(cls, character, quantity=None):
@@ -189,12 +169,10 @@ class OtherScenarios(_ScenarioHelpers):
 
     @classmethod
     def _deposit_gold(cls, character, bank, quantity):
-        character.move(*bank[:2])
-
         if quantity is None:
             quantity = character.gold
 
-        character.deposit_gold(quantity)
+        character.enqueue('move', *bank[:2]).enqueue('deposit_gold', quantity).run_queue()
 
 
 class ScenariosStorage:
@@ -0,0 +1,148 @@
+"""Request count of character actions, against a local stand-in API server.
+
+Run with ``python -m unittest discover tests``.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from base.base import BaseGameClient
+from base.character import Character
+from base.display import Display
+
+
+def _character(name, x=0):
+    return {
+        'name': name, 'level': 1, 'xp': 0, 'max_xp': 100, 'gold': 0, 'hp': 100, 'max_hp': 100,
+        'x': x, 'y': 0, 'layer': 'overworld', 'skin': 'men1', 'cooldown': 0,
+        'cooldown_expiration': '2020-01-01T00:00:00Z', 'inventory': [], 'inventory_max_items': 100,
+    }
+
+
+class _StandIn(BaseHTTPRequestHandler):
+    """Just enough of the API for moves: the character, the move action and the action log."""
+
+    protocol_version = 'HTTP/1.1'
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        self.requests.append(f'GET {path}')
+        if path == '/my/logs':
+            self._reply({'data': [{'description': 'Moved.'}], 'page': 1, 'pages': 1})
+        else:
+            self._reply({'data': _character(path.rsplit('/', 1)[-1])})
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length') or 0)) or b'{}')
+        self.requests.append(f'POST {self.path}')
+        name = self.path.split('/')[2]
+        self._reply({'data': {
+            'cooldown': {'total_seconds': 0, 'remaining_seconds': 0, 'reason': 'movement'},
+            'character': _character(name, x=body.get('x', 0)),
+        }})
+
+
+class _QuietDisplay(Display):
+    def _output(self, text):
+        pass
+
+    def _show_window(self, title, text):
+        pass
+
+    def _update_char_info(self, text):
+        pass
+
+    def _update_location_text(self, text):
+        pass
+
+    def print(self, *args, **kwargs):
+        pass
+
+    def input(self, prompt=''):
+        return ''
+
+    def prompt_int(self, prompt, min_val=None, max_val=None):
+        return None
+
+    def prompt_str(self, prompt, allow_empty=True):
+        return ''
+
+    def prompt_yes_no(self, prompt):
+        return False
+
+    def show_image(self, category, key):
+        pass
+
+    def show_basic_actions(self, location_type):
+        pass
+
+    def show_advanced_actions(self):
+        pass
+
+    def show_character_actions(self):
+        pass
+
+
+class ActionRequestCountTest(unittest.TestCase):
+    MOVES = 10
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _StandIn)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def _count_requests(self, action_log):
+        with tempfile.TemporaryDirectory() as directory:
+            config_path = os.path.join(directory, 'config.ini')
+            with open(config_path, 'w') as fh:
+                fh.write(f'[General]\nTOKEN = test\nACTION_LOG = {str(action_log).lower()}\n')
+
+            with mock.patch.object(BaseGameClient, 'CONFIG_PATH', config_path):
+                parent = BaseGameClient()
+                parent.base_url = f'http://127.0.0.1:{self.server.server_port}'
+                character = Character('hero', parent=parent, display=_QuietDisplay())
+
+                _StandIn.requests.clear()
+                for x in range(1, self.MOVES + 1):
+                    character.move(x, 0)
+
+        return list(_StandIn.requests), character
+
+    def test_one_request_per_action(self):
+        requests, character = self._count_requests(action_log=False)
+
+        self.assertEqual(len(requests), self.MOVES)
+        self.assertEqual(set(requests), {'POST /my/hero/action/move'})
+        self.assertEqual(character.x, self.MOVES)
+
+    def test_action_log_adds_one_request_per_action(self):
+        requests, _ = self._count_requests(action_log=True)
+
+        self.assertEqual(len(requests), 2 * self.MOVES)
+        self.assertEqual(requests.count('GET /my/logs'), self.MOVES)
+
+
+if __name__ == '__main__':
+    unittest.main()